@@ -4,7 +4,7 @@ import sys
 import os
 import requests
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -12,10 +12,87 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.core.crew import DocumentationCrew, extract_markdown_from_response
 from src.utils.logger import setup_logger
 from src.utils.validators import validate_gitlab_project
+from src.utils.files import atomic_write
 from src.config.settings import get_settings
 
 logger = setup_logger(__name__)
 
+# Custom CSS with green theme
+CUSTOM_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: 700;
+        color: #2D5F2E;
+        margin-bottom: 0.5rem;
+        letter-spacing: -0.5px;
+    }
+    .sub-header {
+        font-size: 1.1rem;
+        color: #5a6c57;
+        margin-bottom: 2rem;
+        font-weight: 400;
+    }
+    .stButton > button {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: 600;
+        border-radius: 4px;
+        padding: 0.6rem 2rem;
+        border: none;
+        transition: all 0.3s ease;
+    }
+    .stButton > button:hover {
+        background-color: #45a049;
+        box-shadow: 0 2px 8px rgba(76, 175, 80, 0.3);
+    }
+    .success-box {
+        padding: 1rem;
+        border-radius: 4px;
+        background-color: #e8f5e9;
+        border-left: 4px solid #4CAF50;
+        margin: 1rem 0;
+        color: #2e7d32;
+    }
+    .info-box {
+        padding: 1rem;
+        border-radius: 4px;
+        background-color: #f1f8f4;
+        border-left: 4px solid #81c784;
+        margin: 1rem 0;
+        color: #2D5F2E;
+    }
+    .metric-card {
+        background-color: #f1f8f4;
+        padding: 1rem;
+        border-radius: 4px;
+        border: 1px solid #c8e6c9;
+    }
+    /* Sidebar styling */
+    [data-testid="stSidebar"] {
+        background-color: #f8fdf9;
+    }
+    /* Header separator */
+    .header-line {
+        height: 3px;
+        background: linear-gradient(90deg, #4CAF50 0%, #81c784 100%);
+        margin: 1rem 0 2rem 0;
+        border-radius: 2px;
+    }
+</style>
+"""
+
+# Page header (title, subtitle, separator)
+HEADER_HTML = (
+    '<div class="main-header">NoBuddy - Your Onboarding Buddy</div>'
+    '<div class="sub-header">Your team’s knowledge, instantly searchable for easy project onboarding. Turns "nobody knows" into "NoBuddy knows".</div>'
+    '<div class="header-line"></div>'
+)
+
+# Built once at import and sent as a single markdown element per rerun
+PAGE_HEADER_HTML = CUSTOM_CSS + HEADER_HTML
+
+
 # Initialize session state
 if 'authenticated' not in st.session_state:
     st.session_state.authenticated = False
@@ -130,6 +207,85 @@ def verify_gitlab_token(gitlab_token: str, gitlab_url: str) -> bool:
         return False
 
 
+class _DriveUnavailableError(Exception):
+    """Raised inside the cached crew builder so a crew whose Drive tool failed is not cached."""
+
+
+# Bounded so idle sessions' crews (and the tokens held by their tools) are released
+@st.cache_resource(show_spinner=False, max_entries=16, ttl=3600)
+def _build_crew(
+    gitlab_token: str,
+    drive_token: Optional[str],
+    enable_drive: bool,
+    enable_rag: bool
+) -> DocumentationCrew:
+    """Build a DocumentationCrew; see get_crew."""
+    crew = DocumentationCrew(
+        enable_google_drive=enable_drive,
+        enable_rag=enable_rag
+    )
+    # Streamlit does not cache exceptions, so a transient MCP outage is retried next run
+    if enable_drive and not crew.enable_google_drive:
+        raise _DriveUnavailableError("Google Drive tool unavailable")
+    return crew
+
+
+def get_crew(
+    gitlab_token: str,
+    drive_token: Optional[str],
+    enable_drive: bool,
+    enable_rag: bool
+) -> DocumentationCrew:
+    """
+    Get a DocumentationCrew for the given tokens and integrations.
+
+    Cached across reruns so the LLM wrappers, tools and their pooled HTTP
+    sessions are built once per configuration. The tokens are part of the
+    cache key so a crew is never shared between users; settings must already
+    be loaded for these tokens via get_settings. Entries expire after an hour.
+    Without a Drive token, or if the Drive tool fails to initialize, the cached
+    crew without Drive is used; only the Drive-enabled crew is retried next run.
+
+    Args:
+        gitlab_token: GitLab personal access token
+        drive_token: Google Drive token (None if Drive is disabled)
+        enable_drive: Whether to enable Google Drive search
+        enable_rag: Whether to enable internal knowledge base search
+
+    Returns:
+        DocumentationCrew instance
+    """
+    if enable_drive and drive_token:
+        try:
+            return _build_crew(gitlab_token, drive_token, True, enable_rag)
+        except _DriveUnavailableError:
+            logger.warning("Google Drive unavailable; using the crew without Drive")
+    elif enable_drive:
+        logger.warning("No Google Drive token; using the crew without Drive")
+    return _build_crew(gitlab_token, None, False, enable_rag)
+
+
+@st.cache_data(ttl=5)
+def list_learning_path_files() -> List[Path]:
+    """
+    List previously generated learning path files in the working directory.
+
+    Uses a single os.scandir pass instead of one glob per pattern, and is
+    cached briefly so widget interactions don't rescan the directory.
+
+    Returns:
+        Sorted list of learning path and documentation markdown files
+    """
+    with os.scandir(".") as entries:
+        return sorted(
+            Path(entry.name)
+            for entry in entries
+            if entry.name.startswith(("learning_path_", "documentation_"))
+            and entry.name.endswith(".md")
+            and entry.is_file()
+        )
+
+
 # Page configuration
 st.set_page_config(
     page_title="NoBuddy",
@@ -138,75 +294,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS with green theme
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #2D5F2E;
-        margin-bottom: 0.5rem;
-        letter-spacing: -0.5px;
-    }
-    .sub-header {
-        font-size: 1.1rem;
-        color: #5a6c57;
-        margin-bottom: 2rem;
-        font-weight: 400;
-    }
-    .stButton > button {
-        background-color: #4CAF50;
-        color: white;
-        font-weight: 600;
-        border-radius: 4px;
-        padding: 0.6rem 2rem;
-        border: none;
-        transition: all 0.3s ease;
-    }
-    .stButton > button:hover {
-        background-color: #45a049;
-        box-shadow: 0 2px 8px rgba(76, 175, 80, 0.3);
-    }
-    .success-box {
-        padding: 1rem;
-        border-radius: 4px;
-        background-color: #e8f5e9;
-        border-left: 4px solid #4CAF50;
-        margin: 1rem 0;
-        color: #2e7d32;
-    }
-    .info-box {
-        padding: 1rem;
-        border-radius: 4px;
-        background-color: #f1f8f4;
-        border-left: 4px solid #81c784;
-        margin: 1rem 0;
-        color: #2D5F2E;
-    }
-    .metric-card {
-        background-color: #f1f8f4;
-        padding: 1rem;
-        border-radius: 4px;
-        border: 1px solid #c8e6c9;
-    }
-    /* Sidebar styling */
-    [data-testid="stSidebar"] {
-        background-color: #f8fdf9;
-    }
-    /* Header separator */
-    .header-line {
-        height: 3px;
-        background: linear-gradient(90deg, #4CAF50 0%, #81c784 100%);
-        margin: 1rem 0 2rem 0;
-        border-radius: 2px;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Header
-st.markdown('<div class="main-header">NoBuddy - Your Onboarding Buddy</div>', unsafe_allow_html=True)
-st.markdown('<div class="sub-header">Your team’s knowledge, instantly searchable for easy project onboarding. Turns "nobody knows" into "NoBuddy knows".</div>', unsafe_allow_html=True)
-st.markdown('<div class="header-line"></div>', unsafe_allow_html=True)
+# Custom CSS with green theme, followed by the page header
+st.markdown(PAGE_HEADER_HTML, unsafe_allow_html=True)
 
 # Login page - shown if not authenticated
 if not st.session_state.authenticated:
@@ -309,25 +398,35 @@ with st.sidebar:
         st.warning("No projects loaded. Please logout and login again.")
         project_input = ""
 
-    st.markdown("### Integration Options")
-    enable_drive = st.checkbox(
-        "Enable Google Drive Search",
-        value=False,
-        help="Search Google Drive for reference documentation"
-    )
+    # Integration and output options are grouped in a form whose submit starts
+    # generation, so the run always uses the options currently shown and toggling
+    # them does not rerun the script per widget change
+    with st.form("config_form"):
+        st.markdown("### Integration Options")
+        enable_drive = st.checkbox(
+            "Enable Google Drive Search",
+            value=False,
+            help="Search Google Drive for reference documentation"
+        )
 
-    enable_rag = st.checkbox(
-        "Enable Internal Knowledge Base",
-        value=False,
-        help="Search internal Milvus knowledge base for relevant information"
-    )
+        enable_rag = st.checkbox(
+            "Enable Internal Knowledge Base",
+            value=False,
+            help="Search internal Milvus knowledge base for relevant information"
+        )
 
-    st.markdown("### Output Settings")
-    output_file = st.text_input(
-        "Output Filename (optional)",
-        placeholder="documentation.md",
-        help="Leave empty to auto-generate filename"
-    )
+        st.markdown("### Output Settings")
+        output_file = st.text_input(
+            "Output Filename (optional)",
+            placeholder="documentation.md",
+            help="Leave empty to auto-generate filename"
+        )
+
+        generate_button = st.form_submit_button(
+            "Generate Learning Path",
+            type="primary",
+            use_container_width=True
+        )
 
     st.markdown("---")
     st.markdown("### About")
@@ -336,8 +435,9 @@ with st.sidebar:
     - GPT OSS 120B: For tool calling and data fetching
     - Sahabat AI 70B: For learning path writing
 
+    **GitLab data** (code & snippets) is fetched directly.
+
     **Agents:**
-    - GitLab Data Analyzer (fetches code & snippets)
     - Google Drive Analyzer (extracts key points)
     - Internal KB Analyzer (searches knowledge base)
     - Learning Path Writer (creates guided path)
@@ -348,7 +448,7 @@ with st.expander("View Existing Learning Paths", expanded=False):
     st.markdown("Load and view previously generated learning paths")
 
     # List existing markdown files
-    existing_files = list(Path(".").glob("learning_path_*.md")) + list(Path(".").glob("documentation_*.md"))
+    existing_files = list_learning_path_files()
 
     if existing_files:
         selected_file = st.selectbox(
@@ -358,11 +458,13 @@ with st.expander("View Existing Learning Paths", expanded=False):
         )
 
         if selected_file and st.button("Load File"):
-            with open(selected_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = selected_file.read_text(encoding='utf-8')
 
-            # Extract and clean markdown (in case it has JSON wrapping)
-            cleaned_content = extract_markdown_from_response(content)
+            # Extract and clean markdown (only needed if it has JSON or code-block wrapping)
+            if content.lstrip().startswith(("{", "```")):
+                cleaned_content = extract_markdown_from_response(content)
+            else:
+                cleaned_content = content
 
             st.markdown("---")
             st.markdown("### File Content")
@@ -385,6 +487,9 @@ with st.expander("View Existing Learning Paths", expanded=False):
 
 st.markdown("---")
 
+# Validate the selected project once per rerun
+is_valid_project = bool(project_input) and validate_gitlab_project(project_input)
+
 # Main content
 col1, col2 = st.columns([2, 1])
 
@@ -393,17 +498,16 @@ with col1:
 
     # Validation feedback
     if project_input:
-        if validate_gitlab_project(project_input):
+        if is_valid_project:
             st.markdown(f'<div class="success-box">✓ Valid project format: <strong>{project_input}</strong></div>', unsafe_allow_html=True)
         else:
             st.error("✗ Invalid project format. Expected: namespace/project-name")
 
-    # Generate button
-    generate_button = st.button("Generate Learning Path", type="primary", use_container_width=True)
+    st.caption("Choose integration and output options in the sidebar, then click **Generate Learning Path**.")
 
 with col2:
     st.markdown("### Agent Status")
-    agent_count = 2  # Minimum: GitLab + Writer
+    agent_count = 1  # Minimum: Writer (GitLab data is fetched directly)
     if enable_drive:
         agent_count += 1
     if enable_rag:
@@ -413,17 +517,18 @@ with col2:
     st.markdown("")
     st.markdown(f"""
     **Enabled Agents:**
-    - {'✓' if True else '✗'} GitLab Data Analyzer
     - {'✓' if enable_drive else '✗'} Google Drive Analyzer
     - {'✓' if enable_rag else '✗'} Internal KB Analyzer
-    - {'✓' if True else '✗'} Learning Path Writer
+    - ✓ Learning Path Writer
+
+    GitLab data is always fetched directly (no agent).
     """)
 
 # Learning path generation
 if generate_button:
     if not project_input:
         st.error("✗ Please select a GitLab project")
-    elif not validate_gitlab_project(project_input):
+    elif not is_valid_project:
         st.error("✗ Invalid project format. Expected: namespace/project-name")
     else:
         try:
@@ -446,8 +551,10 @@ if generate_button:
                     force_reload=True
                 )
 
-                doc_crew = DocumentationCrew(
-                    enable_google_drive=enable_drive,
+                doc_crew = get_crew(
+                    gitlab_token=st.session_state.gitlab_token,
+                    drive_token=st.session_state.drive_token if enable_drive else None,
+                    enable_drive=enable_drive,
                     enable_rag=enable_rag
                 )
 
@@ -455,17 +562,30 @@ if generate_button:
                 status_text.text(f"Generating learning path for {project_input}...")
                 progress_bar.progress(30)
 
-                with st.spinner(f"Agents are collaborating to create your learning path..."):
-                    documentation = doc_crew.generate_documentation(project_input)
-
-                progress_bar.progress(80)
-                status_text.text("Saving learning path...")
-
-                # Save learning path
-                output_path = doc_crew.save_documentation(
-                    documentation,
-                    output_file if output_file else None
-                )
+                # Stream the writer's output to the page and to a temporary file next to
+                # the target, which replaces it only once generation has succeeded
+                # (the temp file is also discarded when Streamlit stops the script)
+                output_path = output_file or doc_crew.default_output_file(project_input)
+                with atomic_write(output_path, buffering=1 << 16) as sink:
+                    live_output = st.empty()
+                    with st.spinner(f"Agents are collaborating to create your learning path..."):
+                        with live_output.container():
+                            streamed_markdown = st.write_stream(
+                                doc_crew.stream_documentation(project_input, writer_sink=sink)
+                            )
+                    live_output.empty()
+
+                    documentation = doc_crew.build_documentation_result(project_input, streamed_markdown)
+
+                    progress_bar.progress(80)
+                    status_text.text("Saving learning path...")
+
+                    # Rewrite the streamed file only if cleaning changed the content
+                    if documentation["documentation"] != streamed_markdown:
+                        sink.seek(0)
+                        sink.truncate()
+                        sink.write(documentation["documentation"])
+                list_learning_path_files.clear()
 
                 progress_bar.progress(100)
                 status_text.text("✓ Learning path generated successfully")
@@ -507,7 +627,7 @@ if generate_button:
                 st.code(str(e))
 
 # Code Q&A Section (only show if user has selected a project)
-if project_input and validate_gitlab_project(project_input):
+if is_valid_project:
     st.markdown("---")
     st.markdown("### Ask Questions About the Code")
     st.markdown("Deep dive into the repository code to understand specific aspects like feature processing, architecture, or implementation details.")
@@ -545,9 +665,11 @@ if project_input and validate_gitlab_project(project_input):
                         force_reload=True
                     )
 
-                    # Create crew instance
-                    doc_crew = DocumentationCrew(
-                        enable_google_drive=False,
+                    # Get (cached) crew instance
+                    doc_crew = get_crew(
+                        gitlab_token=st.session_state.gitlab_token,
+                        drive_token=None,
+                        enable_drive=False,
                         enable_rag=False
                     )
 
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """Utility script to fix markdown files with JSON wrapping or escaped newlines"""
-import json
 import sys
 from pathlib import Path
 
@@ -8,6 +7,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.crew import extract_markdown_from_response
+from src.utils.files import atomic_write
 
 
 def fix_markdown_file(filepath: str) -> None:
@@ -19,14 +19,17 @@ def fix_markdown_file(filepath: str) -> None:
         return
 
     # Read the file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = file_path.read_text(encoding='utf-8')
 
     # Extract and clean markdown
     cleaned_markdown = extract_markdown_from_response(content)
 
-    # Write back to file
-    with open(file_path, 'w', encoding='utf-8') as f:
+    if cleaned_markdown == content:
+        print(f"✅ Already clean: {filepath}")
+        return
+
+    # Write to a temporary file and swap it in, so a crash never leaves a truncated file
+    with atomic_write(file_path) as f:
         f.write(cleaned_markdown)
 
     print(f"✅ Fixed: {filepath}")
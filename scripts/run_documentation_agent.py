@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Main entry point for running the documentation generation agent"""
 import sys
+import time
 import argparse
 from pathlib import Path
 
@@ -11,6 +12,7 @@ sys.path.insert(0, str(src_path))
 from src.core import DocumentationCrew
 from src.utils.logger import setup_logger
 from src.utils.validators import validate_gitlab_project
+from src.utils.files import atomic_write
 
 logger = setup_logger(__name__)
 
@@ -36,13 +38,18 @@ Examples:
 
   # Specify custom output file
   python scripts/run_documentation_agent.py gopay-ds/Growth/my-project --output my-docs.json
+
+  # Generate documentation for several projects concurrently
+  python scripts/run_documentation_agent.py gopay-ds/Growth/project-a gopay-ds/Growth/project-b
         """
     )
 
     parser.add_argument(
-        'project',
+        'projects',
         type=str,
-        help='GitLab project in format "namespace/project" (e.g., "gopay-ds/Growth/my-project")'
+        nargs='+',
+        metavar='project',
+        help='GitLab project(s) in format "namespace/project" (e.g., "gopay-ds/Growth/my-project")'
     )
 
     parser.add_argument(
@@ -62,19 +69,62 @@ Examples:
         '-o',
         type=str,
         default=None,
-        help='Output file path (default: auto-generated from project name)'
+        help='Output file path (default: auto-generated from project name; single project only)'
+    )
+
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=4,
+        help='Maximum number of projects generated concurrently (default: 4)'
     )
 
     parser.add_argument(
         '--verbose',
         '-v',
         action='store_true',
-        help='Enable verbose logging'
+        help='Enable verbose logging and CrewAI agent output'
     )
 
     return parser.parse_args()
 
 
+def run_batch(doc_crew: DocumentationCrew, projects: list, max_workers: int) -> int:
+    """
+    Generate and save documentation for several projects concurrently.
+
+    Args:
+        doc_crew: Initialized documentation crew
+        projects: GitLab projects in format 'namespace/project'
+        max_workers: Maximum number of projects generated concurrently
+
+    Returns:
+        Exit code (0 if every project succeeded, 1 otherwise)
+    """
+    logger.info(f"Generating documentation for {len(projects)} projects")
+    failures = 0
+    start = time.perf_counter()
+
+    # Save each learning path as soon as its project finishes
+    results = doc_crew.generate_documentation_batch(projects, max_workers=max_workers)
+    for done, (project, documentation) in enumerate(results, start=1):
+        elapsed = time.perf_counter() - start
+        if "error" in documentation:
+            failures += 1
+            print(f"[{done}/{len(projects)}] ❌ {project} failed after {elapsed:.1f}s: {documentation['error']}")
+            continue
+
+        output_file = doc_crew.save_documentation(documentation)
+        print(f"[{done}/{len(projects)}] ✅ {project} done in {elapsed:.1f}s -> {output_file}")
+
+    print()
+    print("=" * 80)
+    print(f"Batch complete: {len(projects) - failures}/{len(projects)} succeeded")
+    print("=" * 80)
+
+    return 1 if failures else 0
+
+
 def main():
     """Main function to run the documentation generation."""
     args = parse_arguments()
@@ -85,16 +135,21 @@ def main():
         logger.setLevel(logging.DEBUG)
 
     # Validate project format
-    if not validate_gitlab_project(args.project):
-        logger.error(f"Invalid project format: {args.project}")
-        logger.error("Expected format: namespace/project (e.g., 'gopay-ds/Growth/my-project')")
+    for project in args.projects:
+        if not validate_gitlab_project(project):
+            logger.error(f"Invalid project format: {project}")
+            logger.error("Expected format: namespace/project (e.g., 'gopay-ds/Growth/my-project')")
+            sys.exit(1)
+
+    if args.output and len(args.projects) > 1:
+        logger.error("--output can only be used with a single project")
         sys.exit(1)
 
     # Print configuration
     print("=" * 80)
     print(f"Documentation Generation for GitLab Project")
     print("=" * 80)
-    print(f"Project: {args.project}")
+    print(f"Project(s): {', '.join(args.projects)}")
     print(f"Google Drive integration: {'ENABLED' if args.with_drive else 'DISABLED'}")
     print(f"RAG integration: {'ENABLED' if args.with_rag else 'DISABLED'}")
     print("=" * 80)
@@ -105,15 +160,28 @@ def main():
         logger.info("Initializing documentation crew...")
         doc_crew = DocumentationCrew(
             enable_google_drive=args.with_drive,
-            enable_rag=args.with_rag
+            enable_rag=args.with_rag,
+            verbose=args.verbose or None
         )
 
-        # Generate documentation
-        logger.info(f"Generating documentation for project: {args.project}")
-        documentation = doc_crew.generate_documentation(args.project)
+        if len(args.projects) > 1:
+            return run_batch(doc_crew, args.projects, args.max_workers)
+
+        project = args.projects[0]
+
+        # Generate documentation, streaming the learning path into a temporary file
+        # that replaces the output file only once generation has succeeded
+        logger.info(f"Generating documentation for project: {project}")
+        output_file = args.output or doc_crew.default_output_file(project)
+        with atomic_write(output_file, buffering=1 << 16) as sink:
+            raw_output = "".join(doc_crew.stream_documentation(project, writer_sink=sink))
 
-        # Save to file
-        output_file = doc_crew.save_documentation(documentation, args.output)
+            # Rewrite the file only if cleaning changed the streamed content
+            documentation = doc_crew.build_documentation_result(project, raw_output)
+            if documentation["documentation"] != raw_output:
+                sink.seek(0)
+                sink.truncate()
+                sink.write(documentation["documentation"])
 
         # Print success message
         print()
@@ -7,6 +7,7 @@ class LLMModel(str, Enum):
     """Available LLM models"""
     GPT_OSS = "openai/gpt-oss-120b"
     SAHABAT_4BIT = "GoToCompany/Llama-Sahabat-AI-v2-70B-IT-awq-4bit"
+    SAHABAT_FP8 = "GoToCompany/Llama-Sahabat-AI-v2-70B-IT-fp8"
     EMBEDDING_GEMMA = "google/embeddinggemma-300m"
 
 
@@ -19,6 +20,14 @@ class AgentRole(str, Enum):
     CODE_QA_AGENT = "Code Q&A Agent"
 
 
+class LLMCacheMode(str, Enum):
+    """LLM response cache modes"""
+    READ_WRITE = "readWrite"
+    READ_ONLY = "readOnly"
+    WRITE_ONLY = "writeOnly"
+    OFF = "off"
+
+
 class ToolName(str, Enum):
     """Tool name definitions"""
     GITLAB_TOOL = "GitLab Project Analyzer"
@@ -26,13 +35,41 @@ class ToolName(str, Enum):
     RAG_TOOL = "Internal Knowledge Base Search"
 
 
+# Writer model for each quantization variant (selected via LLM_WRITER_VARIANT)
+WRITER_MODEL_VARIANTS = {
+    "awq4": LLMModel.SAHABAT_4BIT,
+    "fp8": LLMModel.SAHABAT_FP8,
+}
+
 # RAG Milvus collection name (single combined collection)
 RAG_COLLECTION_NAME = "combined_item"
 
 # Default values
 DEFAULT_TEMPERATURE_TOOL_CALLING = 0.3
 DEFAULT_TEMPERATURE_WRITING = 0.6
+# Completion token caps (0 disables); bound worst-case decode time per call
+DEFAULT_MAX_TOKENS_TOOL_CALLING = 1500
+DEFAULT_MAX_TOKENS_WRITING = 4096
 DEFAULT_RAG_TOP_K = 5
 DEFAULT_DRIVE_TOP_K = 3
 DEFAULT_REQUEST_TIMEOUT = 300
 DEFAULT_EMBEDDING_TIMEOUT = 30
+DEFAULT_LLM_CACHE_DIR = "~/.cache/goto-llm"
+DEFAULT_LLM_CACHE_TTL = 3600
+# Responses sampled above this temperature are non-deterministic and never cached
+LLM_CACHE_MAX_TEMPERATURE = 0.3
+GITLAB_CACHE_TTL = 300
+GITLAB_CACHE_MAX_ENTRIES = 256
+RAG_CACHE_TTL = 600
+RAG_CACHE_MAX_ENTRIES = 512
+# Shorter queries return no results without a search; longer ones are truncated
+RAG_MIN_QUERY_CHARS = 3
+RAG_MAX_QUERY_CHARS = 8192
+# Paraphrased queries at or above this cosine similarity reuse a cached result
+RAG_SEMANTIC_CACHE_THRESHOLD = 0.97
+RAG_SEMANTIC_CACHE_MAX_ENTRIES = 256
+# Concurrent embedding queries arriving within the wait window share one request
+EMBEDDING_BATCH_MAX_SIZE = 32
+EMBEDDING_BATCH_WAIT_MS = 10
+# Enough bytes for the first 1000 README characters even if all are multi-byte
+README_MAX_BYTES = 4096
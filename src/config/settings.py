@@ -4,6 +4,14 @@ from typing import Optional
 from dotenv import load_dotenv
 from dataclasses import dataclass
 
+from src.config.constants import (
+    LLMCacheMode,
+    DEFAULT_LLM_CACHE_DIR,
+    DEFAULT_LLM_CACHE_TTL,
+    DEFAULT_MAX_TOKENS_TOOL_CALLING,
+    DEFAULT_MAX_TOKENS_WRITING
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -48,12 +56,26 @@ class LLMConfig:
     """LLM endpoint configuration"""
     endpoint: str
     timeout: int
+    cache_mode: str
+    cache_dir: str
+    cache_ttl: int
+    prompt_caching: bool
+    writer_variant: str
+    tool_max_tokens: int
+    writer_max_tokens: int
 
     @classmethod
     def from_env(cls) -> "LLMConfig":
         return cls(
             endpoint=os.getenv("LLM_ENDPOINT", "https://litellm-staging.gopay.sh"),
-            timeout=int(os.getenv("LLM_TIMEOUT", "300"))
+            timeout=int(os.getenv("LLM_TIMEOUT", "300")),
+            cache_mode=os.getenv("LLM_CACHE_MODE", LLMCacheMode.OFF.value),
+            cache_dir=os.getenv("LLM_CACHE_DIR", DEFAULT_LLM_CACHE_DIR),
+            cache_ttl=int(os.getenv("LLM_CACHE_TTL", str(DEFAULT_LLM_CACHE_TTL))),
+            prompt_caching=os.getenv("LLM_PROMPT_CACHING", "false").lower() == "true",
+            writer_variant=os.getenv("LLM_WRITER_VARIANT", "awq4"),
+            tool_max_tokens=int(os.getenv("LLM_TOOL_MAX_TOKENS", str(DEFAULT_MAX_TOKENS_TOOL_CALLING))),
+            writer_max_tokens=int(os.getenv("LLM_WRITER_MAX_TOKENS", str(DEFAULT_MAX_TOKENS_WRITING)))
         )
 
 
@@ -64,6 +86,10 @@ class RAGConfig:
     embedding_endpoint: str
     embedding_model: str
     top_k: int
+    metric_type: str
+    ef_search: int
+    nprobe: int
+    semantic_cache: bool
 
     @classmethod
     def from_env(cls) -> "RAGConfig":
@@ -71,7 +97,11 @@ class RAGConfig:
             db_path=os.getenv("MILVUS_DB_PATH", "./milvus_demo_batch_bmth_v3_3.db"),
             embedding_endpoint=os.getenv("EMBEDDING_ENDPOINT", "https://litellm-staging.gopay.sh/embeddings"),
             embedding_model=os.getenv("EMBEDDING_MODEL", "GoToCompany/embeddinggemma-300m-gotoai-v1"),
-            top_k=int(os.getenv("RAG_TOP_K", "5"))
+            top_k=int(os.getenv("RAG_TOP_K", "5")),
+            metric_type=os.getenv("MILVUS_METRIC_TYPE", ""),
+            ef_search=int(os.getenv("MILVUS_EF_SEARCH", "0")),
+            nprobe=int(os.getenv("MILVUS_NPROBE", "0")),
+            semantic_cache=os.getenv("RAG_SEMANTIC_CACHE", "false").lower() == "true"
         )
 
     def is_configured(self) -> bool:
@@ -86,6 +116,7 @@ class Settings:
     google_drive: GoogleDriveConfig
     llm: LLMConfig
     rag: RAGConfig
+    crew_verbose: bool
 
     @classmethod
     def load(cls, gitlab_token: Optional[str] = None, drive_token: Optional[str] = None) -> "Settings":
@@ -94,7 +125,8 @@ class Settings:
             gitlab=GitLabConfig.from_env(runtime_token=gitlab_token),
             google_drive=GoogleDriveConfig.from_env(runtime_token=drive_token),
             llm=LLMConfig.from_env(),
-            rag=RAGConfig.from_env()
+            rag=RAGConfig.from_env(),
+            crew_verbose=os.getenv("CREW_VERBOSE", "false").lower() == "true"
         )
 
 
@@ -1,15 +1,23 @@
 """Core crew orchestration for documentation generation"""
+import asyncio
 import json
 import re
-from typing import Dict, Optional, List
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterator, Optional, List, TextIO, Tuple
 from crewai import Agent, Task, Crew, Process
 
 from src.config.settings import get_settings
-from src.config.constants import LLMModel, DEFAULT_TEMPERATURE_TOOL_CALLING, DEFAULT_TEMPERATURE_WRITING
+from src.config.constants import (
+    LLMModel,
+    WRITER_MODEL_VARIANTS,
+    DEFAULT_TEMPERATURE_TOOL_CALLING,
+    DEFAULT_TEMPERATURE_WRITING
+)
 from src.tools import GitLabMCPTool, GoogleDriveMCPTool, RAGMilvusTool, GitLabCodeQATool
 from src.llm import create_tool_calling_llm, create_writing_llm
 from src.agents import (
-    create_gitlab_analyzer_agent,
     create_drive_analyzer_agent,
     create_rag_analyzer_agent,
     create_documentation_writer_agent,
@@ -20,6 +28,12 @@ from src.utils.validators import validate_gitlab_project, sanitize_filename
 
 logger = setup_logger(__name__)
 
+# Code fence wrapped around an entire agent response (compiled once at import)
+_CODE_FENCE_RE = re.compile(r'^```(?:markdown|md)?[ \t]*\n(.*?)\n```\s*$', re.DOTALL)
+
+# Decodes the leading JSON object of a response, ignoring any trailing text
+_JSON_DECODER = json.JSONDecoder()
+
 
 def extract_markdown_from_response(response: str) -> str:
     """
@@ -38,38 +52,111 @@ def extract_markdown_from_response(response: str) -> str:
     """
     content = response.strip()
 
-    # Try to parse as JSON first
-    try:
-        data = json.loads(content)
-        if isinstance(data, dict):
-            # Look for markdown content in common keys
-            for key in ["markdown_documentation", "documentation", "content", "markdown"]:
-                if key in data and data[key]:
-                    content = data[key]
-                    break
-    except (json.JSONDecodeError, ValueError):
-        pass
-
-    # Remove markdown code blocks if present
-    if content.startswith('```markdown') or content.startswith('```md'):
-        content = re.sub(r'^```(?:markdown|md)\s*\n', '', content)
-        content = re.sub(r'\n```\s*$', '', content)
-    elif content.startswith('```'):
-        content = re.sub(r'^```\s*\n', '', content)
-        content = re.sub(r'\n```\s*$', '', content)
+    # Unwrap JSON responses (only an object can carry the markdown keys). The
+    # object is decoded in one pass up to its closing brace, so a trailing
+    # remark after the JSON does not make the whole parse fail.
+    if content.startswith('{'):
+        try:
+            data, _ = _JSON_DECODER.raw_decode(content)
+            if isinstance(data, dict):
+                # Look for markdown content in common keys
+                for key in ["markdown_documentation", "documentation", "content", "markdown"]:
+                    if key in data and data[key]:
+                        content = data[key]
+                        break
+        except (json.JSONDecodeError, ValueError):
+            pass
+
+    # Unwrap the response only if it is enclosed by both an opening and a closing fence
+    match = _CODE_FENCE_RE.match(content)
+    if match:
+        content = match.group(1)
 
     return content.strip()
 
 
+# Static learning path instructions. The per-project data is appended after
+# them, so this prefix is identical across runs (and prompt-cacheable).
+_LEARNING_PATH_INSTRUCTIONS = (
+    'TASK: Generate a "Learning Path" in Markdown format for the GitLab project given at the end '
+    'of these instructions that guides users to the right resources for onboarding.\n\n'
+    'CRITICAL: This is a LEARNING PATH, not comprehensive documentation. Your goal is to tell users '
+    'WHICH documents and resources to read, not to explain everything in detail.\n\n'
+    'STEPS:\n'
+    '1. Review the GitLab project data at the end of these instructions and all data '
+    'provided by previous agents (Google Drive, RAG)\n'
+    '2. Extract ALL valid links from the agents\' outputs\n'
+    '3. Create a Learning Path with the structure below:\n\n'
+    '## Required Learning Path Structure:\n\n'
+    '# 🎯 Learning Path: [Project Name]\n\n'
+    '## 📋 Overview\n'
+    'Synthesize a brief overview from ALL sources (GitLab description, Drive docs, RAG results):\n'
+    '- What this project does (combine insights from all sources, not just GitLab description)\n'
+    '- Key purpose and use cases\n'
+    '- Technologies used\n'
+    '- Project metadata: [Project URL](link), License, Default Branch\n\n'
+    '## 👥 Recent Contributors\n'
+    '- List recent commit authors with their latest contributions\n'
+    '- Include commit titles and dates\n'
+    '- Keep this section as-is from GitLab data\n\n'
+    '## 📁 Repository Structure\n'
+    'List key directories and files with **clickable links**:\n'
+    '- [filename](https://source.golabs.io/[project]/-/blob/[branch]/[filepath]) - Brief purpose\n'
+    '- Focus on important entry points and configuration files\n\n'
+    '## 💻 Code Snippets (First Look)\n'
+    'Show code snippets from key files (if available from GitLab tool):\n'
+    '- Display the snippet with syntax highlighting\n'
+    '- Include link to full file: [View full file](link)\n'
+    '- Brief explanation of what this file does\n\n'
+    '## 📚 Reference Documentation\n'
+    '**From Google Drive** (if available):\n'
+    '- [Document Name](url) - Use the "url" field from Drive tool results (NOT "uri")\n'
+    '- The "url" field contains clickable Google Docs/Sheets links (https://docs.google.com/...)\n'
+    '- Extract important definitions, concepts, or guidelines mentioned in the Drive search results\n'
+    '- Tell users WHY they should read each document\n\n'
+    '**From Internal Knowledge Base** (if available):\n'
+    '- Relevant context from internal systems (mention the source field)\n'
+    '- How this project relates to company infrastructure\n'
+    '- Links to related internal resources if mentioned\n\n'
+    '## 🚀 Getting Started\n'
+    'Guide users to the right resources:\n'
+    '- "Start by reading [README](link)"\n'
+    '- "Check configuration in [config file](link)"\n'
+    '- "Review setup instructions in [Drive doc](link)" (if available)\n'
+    '- Installation steps (brief, with links to detailed docs)\n\n'
+    'IMPORTANT FORMATTING RULES:\n'
+    '- Every resource MUST have a valid clickable link\n'
+    '- Use format: [Text](url) for all links\n'
+    '- Code snippets should use ```language syntax\n'
+    '- Extract key points from Drive documents, don\'t just list them\n'
+    '- Synthesize the overview from multiple sources\n'
+    '- DO NOT wrap in JSON or code blocks\n'
+    '- Return ONLY raw markdown starting with # header\n\n'
+)
+
+_LEARNING_PATH_EXPECTED_OUTPUT = (
+    'A complete Learning Path in Markdown with:\n'
+    '- Project overview synthesized from GitLab, Drive, and RAG sources\n'
+    '- Recent contributors section (unchanged from GitLab)\n'
+    '- Repository structure with clickable file links\n'
+    '- Code snippets with links to full files\n'
+    '- Reference documentation with key points/definitions extracted\n'
+    '- For Google Drive links: Use the "url" field (https://docs.google.com/...), NOT "uri" (gdrive:///...)\n'
+    '- Getting Started guide with links to resources\n'
+    '- All links properly formatted as [text](url)\n'
+    '- Focus on GUIDING users to resources, not explaining everything\n'
+)
+
+
 class DocumentationCrew:
     """
     CrewAI setup for generating documentation from GitLab projects using collaborating agents.
 
     Architecture:
-    - Agent 1 (GitLab Data Analyzer): Uses gpt-oss LLM with GitLab tool to fetch project data
-    - Agent 2 (Google Drive Analyzer): [Optional] Uses gpt-oss LLM to search Google Drive for reference docs
-    - Agent 3 (RAG Analyzer): [Optional] Uses gpt-oss LLM to search internal knowledge base
-    - Agent 4 (Documentation Writer): Uses sahabat-4bit LLM to write structured JSON documentation
+    - GitLab data: Fetched directly through the GitLab tool and compacted for the writer
+    - Agent 1 (Google Drive Analyzer): [Optional] Uses gpt-oss LLM to search Google Drive for reference docs
+    - Agent 2 (RAG Analyzer): [Optional] Uses gpt-oss LLM to search internal knowledge base
+    - Agent 3 (Documentation Writer): Uses sahabat-4bit LLM to write structured JSON documentation
 
     This design leverages gpt-oss for tool calling capabilities and sahabat-4bit for
     efficient documentation generation.
@@ -78,7 +165,8 @@ class DocumentationCrew:
     def __init__(
         self,
         enable_google_drive: bool = False,
-        enable_rag: bool = False
+        enable_rag: bool = False,
+        verbose: Optional[bool] = None
     ):
         """
         Initialize DocumentationCrew with optional integrations.
@@ -86,12 +174,15 @@ class DocumentationCrew:
         Args:
             enable_google_drive: Whether to enable Google Drive search for reference documentation
             enable_rag: Whether to enable internal knowledge base search
+            verbose: Whether CrewAI prints each agent's reasoning steps to the console
+                (default: CREW_VERBOSE setting, off unless set)
         """
         logger.info("Initializing DocumentationCrew")
 
         settings = get_settings()
         self.enable_google_drive = enable_google_drive
         self.enable_rag = enable_rag
+        self.verbose = settings.crew_verbose if verbose is None else verbose
 
         # Initialize tools
         logger.info("Initializing tools...")
@@ -126,64 +217,40 @@ class DocumentationCrew:
         # Create LLM instances
         logger.info("Initializing dual-LLM architecture:")
         logger.info("  - gpt-oss (GPT OSS 120B): Tool calling & data fetching")
-        logger.info("  - sahabat-4bit (Sahabat AI 70B 4-bit): Documentation writing")
+        logger.info(f"  - sahabat-{settings.llm.writer_variant} (Sahabat AI 70B): Documentation writing")
 
         self.gpt_oss_llm = create_tool_calling_llm(
             endpoint=settings.llm.endpoint,
             model=LLMModel.GPT_OSS,
-            temperature=DEFAULT_TEMPERATURE_TOOL_CALLING
+            temperature=DEFAULT_TEMPERATURE_TOOL_CALLING,
+            max_tokens=settings.llm.tool_max_tokens,
+            cache_mode=settings.llm.cache_mode,
+            cache_dir=settings.llm.cache_dir,
+            cache_ttl=settings.llm.cache_ttl,
+            prompt_caching=settings.llm.prompt_caching
         )
 
+        writer_model = WRITER_MODEL_VARIANTS.get(settings.llm.writer_variant)
+        if writer_model is None:
+            raise ValueError(
+                f"Invalid LLM_WRITER_VARIANT: {settings.llm.writer_variant}. "
+                f"Expected one of: {', '.join(WRITER_MODEL_VARIANTS)}"
+            )
+
         self.sahabat_llm = create_writing_llm(
             endpoint=settings.llm.endpoint,
-            model=LLMModel.SAHABAT_4BIT,
-            temperature=DEFAULT_TEMPERATURE_WRITING
+            model=writer_model,
+            temperature=DEFAULT_TEMPERATURE_WRITING,
+            max_tokens=settings.llm.writer_max_tokens,
+            cache_mode=settings.llm.cache_mode,
+            cache_dir=settings.llm.cache_dir,
+            cache_ttl=settings.llm.cache_ttl,
+            prompt_caching=settings.llm.prompt_caching
         )
 
-    def _create_gitlab_fetch_task(self, agent: Agent, project: str) -> Task:
-        """Create a task for fetching GitLab project data."""
-        return Task(
-            description=(
-                f'TASK: Fetch comprehensive data from the GitLab project "{project}" for LEARNING PATH GENERATION.\n\n'
-                f'⚠️ CRITICAL: Use "GitLab Project Analyzer" tool - NOT "GitLab Code Q&A" tool ⚠️\n'
-                f'The Code Q&A tool is for answering specific questions, NOT for learning path generation.\n\n'
-                f'CRITICAL REQUIREMENT: You MUST call the "GitLab Project Analyzer" tool with the project path "{project}". '
-                f'Do NOT attempt to provide information from your knowledge base. '
-                f'Do NOT skip the tool call. '
-                f'The tool call is MANDATORY and must be executed first.\n\n'
-                f'STEPS:\n'
-                f'1. IMMEDIATELY call the GitLab Project Analyzer tool with input: {project}\n'
-                f'2. Wait for the tool response containing all project data\n'
-                f'3. Parse and present the complete raw data from the tool response\n'
-                f'4. Extract and organize the following information:\n'
-                f'   - Project name, description, default branch, visibility, and license\n'
-                f'   - Stars, forks, open issues count\n'
-                f'   - Topics/tags\n'
-                f'   - Main files and their purposes WITH LINKS\n'
-                f'   - Recent commit activity with contributor names\n'
-                f'   - README content (if available)\n'
-                f'   - Code snippets from key files (with links to full files)\n'
-                f'   - Last activity date\n\n'
-                f'IMPORTANT: Provide ALL the raw data you fetch from the tool. Be thorough and comprehensive. '
-                f'Your output will be used by the Learning Path writer to create the final learning path. '
-                f'Make sure to include all links (project URL, file links from code_snippets section). '
-                f'If you have not called the tool yet, STOP and call it now.'
-            ),
-            expected_output=(
-                'A comprehensive report that begins with confirmation of tool usage, followed by all fetched GitLab project data including:\n'
-                '- Confirmation: "GitLab Project Analyzer tool called successfully with project: {project}"\n'
-                '- Verify you called the correct tool (should return project metadata, NOT deep code analysis)\n'
-                '- Raw tool response data\n'
-                '- Project metadata (name, description, default branch, visibility, license, URL)\n'
-                '- Community metrics (stars, forks, issues)\n'
-                '- File structure and key files\n'
-                '- Code snippets with links to full files (from code_snippets field in tool response)\n'
-                '- Recent activity and commits with contributor names\n'
-                '- Any additional relevant information from the project\n'
-                '- NEVER include deep code analysis from src/ directory (that is for Code Q&A tool)'
-            ),
-            agent=agent
-        )
+        # Agents are cheap to build and keep per-execution state, so each run
+        # gets its own; the Code Q&A tool (and its GitLab session) is shared
+        self._code_qa_tool: Optional[GitLabCodeQATool] = None
 
     def _create_drive_search_task(self, agent: Agent, project: str) -> Task:
         """Create a task for searching Google Drive for reference documentation."""
@@ -292,100 +359,38 @@ class DocumentationCrew:
             agent=agent
         )
 
-    def _create_learning_path_writing_task(self, agent: Agent, project: str) -> Task:
-        """Create a task for writing a learning path based on fetched data."""
+    def _create_learning_path_writing_task(
+        self,
+        agent: Agent,
+        project: str,
+        context: Optional[List[Task]] = None,
+        project_data: str = ""
+    ) -> Task:
+        """
+        Create a task for writing a learning path based on fetched data.
+
+        The static instructions come first and the project name and data last,
+        so the prompt prefix is identical across projects and can be served
+        from the endpoint's prompt cache.
+        """
         return Task(
             description=(
-                f'TASK: Generate a "Learning Path" in Markdown format for the GitLab project "{project}" '
-                f'that guides users to the right resources for onboarding.\n\n'
-                f'CRITICAL: This is a LEARNING PATH, not comprehensive documentation. Your goal is to tell users '
-                f'WHICH documents and resources to read, not to explain everything in detail.\n\n'
-                f'STEPS:\n'
-                f'1. Review all data provided by previous agents (GitLab, Google Drive, RAG)\n'
-                f'2. Extract ALL valid links from the agents\' outputs\n'
-                f'3. Create a Learning Path with the structure below:\n\n'
-                f'## Required Learning Path Structure:\n\n'
-                f'# 🎯 Learning Path: [Project Name]\n\n'
-                f'## 📋 Overview\n'
-                f'Synthesize a brief overview from ALL sources (GitLab description, Drive docs, RAG results):\n'
-                f'- What this project does (combine insights from all sources, not just GitLab description)\n'
-                f'- Key purpose and use cases\n'
-                f'- Technologies used\n'
-                f'- Project metadata: [Project URL](link), License, Default Branch\n\n'
-                f'## 👥 Recent Contributors\n'
-                f'- List recent commit authors with their latest contributions\n'
-                f'- Include commit titles and dates\n'
-                f'- Keep this section as-is from GitLab data\n\n'
-                f'## 📁 Repository Structure\n'
-                f'List key directories and files with **clickable links**:\n'
-                f'- [filename](https://source.golabs.io/[project]/-/blob/[branch]/[filepath]) - Brief purpose\n'
-                f'- Focus on important entry points and configuration files\n\n'
-                f'## 💻 Code Snippets (First Look)\n'
-                f'Show code snippets from key files (if available from GitLab tool):\n'
-                f'- Display the snippet with syntax highlighting\n'
-                f'- Include link to full file: [View full file](link)\n'
-                f'- Brief explanation of what this file does\n\n'
-                f'## 📚 Reference Documentation\n'
-                f'**From Google Drive** (if available):\n'
-                f'- [Document Name](url) - Use the "url" field from Drive tool results (NOT "uri")\n'
-                f'- The "url" field contains clickable Google Docs/Sheets links (https://docs.google.com/...)\n'
-                f'- Extract important definitions, concepts, or guidelines mentioned in the Drive search results\n'
-                f'- Tell users WHY they should read each document\n\n'
-                f'**From Internal Knowledge Base** (if available):\n'
-                f'- Relevant context from internal systems (mention the source field)\n'
-                f'- How this project relates to company infrastructure\n'
-                f'- Links to related internal resources if mentioned\n\n'
-                f'## 🚀 Getting Started\n'
-                f'Guide users to the right resources:\n'
-                f'- "Start by reading [README](link)"\n'
-                f'- "Check configuration in [config file](link)"\n'
-                f'- "Review setup instructions in [Drive doc](link)" (if available)\n'
-                f'- Installation steps (brief, with links to detailed docs)\n\n'
-                f'IMPORTANT FORMATTING RULES:\n'
-                f'- Every resource MUST have a valid clickable link\n'
-                f'- Use format: [Text](url) for all links\n'
-                f'- Code snippets should use ```language syntax\n'
-                f'- Extract key points from Drive documents, don\'t just list them\n'
-                f'- Synthesize the overview from multiple sources\n'
-                f'- DO NOT wrap in JSON or code blocks\n'
-                f'- Return ONLY raw markdown starting with # header\n'
-            ),
-            expected_output=(
-                'A complete Learning Path in Markdown with:\n'
-                '- Project overview synthesized from GitLab, Drive, and RAG sources\n'
-                '- Recent contributors section (unchanged from GitLab)\n'
-                '- Repository structure with clickable file links\n'
-                '- Code snippets with links to full files\n'
-                '- Reference documentation with key points/definitions extracted\n'
-                '- For Google Drive links: Use the "url" field (https://docs.google.com/...), NOT "uri" (gdrive:///...)\n'
-                '- Getting Started guide with links to resources\n'
-                '- All links properly formatted as [text](url)\n'
-                '- Focus on GUIDING users to resources, not explaining everything\n'
+                _LEARNING_PATH_INSTRUCTIONS +
+                f'GITLAB PROJECT DATA (JSON):\n{project_data}\n\n'
+                f'PROJECT: {project}\n'
             ),
-            agent=agent
+            expected_output=_LEARNING_PATH_EXPECTED_OUTPUT,
+            agent=agent,
+            context=context
         )
 
     # Backward compatibility alias
     _create_documentation_writing_task = _create_learning_path_writing_task
 
-    def generate_documentation(self, project: str) -> Dict:
-        """
-        Generate documentation for a given GitLab project using collaborating agents.
-
-        Args:
-            project: GitLab project in format 'namespace/project'
-
-        Returns:
-            Dictionary containing the generated documentation
-
-        Raises:
-            ValueError: If project format is invalid
-        """
-        if not validate_gitlab_project(project):
-            raise ValueError(f"Invalid project format: {project}. Expected format: namespace/project")
-
+    def _log_collaboration_plan(self, project: str) -> None:
+        """Log which agents will collaborate on the given project."""
         # Calculate agent count
-        agent_count = 2  # GitLab + Writer (minimum)
+        agent_count = 1  # Writer (minimum)
         if self.enable_google_drive:
             agent_count += 1
         if self.enable_rag:
@@ -393,62 +398,345 @@ class DocumentationCrew:
 
         logger.info("=" * 60)
         logger.info(f"Starting {agent_count}-agent collaboration for project: {project}")
-        logger.info(f"  Agent 1 (gpt-oss): Fetching GitLab data with code snippets...")
+        logger.info(f"  GitLab: Fetching project data with code snippets (direct API call)...")
         if self.enable_google_drive:
-            logger.info(f"  Agent 2 (gpt-oss): Searching Google Drive for reference docs...")
+            logger.info(f"  Agent 1 (gpt-oss): Searching Google Drive for reference docs...")
         if self.enable_rag:
-            logger.info(f"  Agent {3 if self.enable_google_drive else 2} (gpt-oss): Searching internal knowledge base...")
-        logger.info(f"  Agent {agent_count} (sahabat-4bit): Writing learning path...")
+            logger.info(f"  Agent {2 if self.enable_google_drive else 1} (gpt-oss): Searching internal knowledge base...")
+        logger.info(f"  Agent {agent_count} (sahabat): Writing learning path...")
         logger.info("=" * 60)
 
-        # Create agents and tasks
+    def _fetch_gitlab_context(self, project: str) -> str:
+        """
+        Fetch GitLab project data and serialize the writer-relevant fields.
+
+        Args:
+            project: GitLab project in format 'namespace/project'
+
+        Returns:
+            Compact JSON string with the project's overview, structure, activity,
+            README and code snippets
+
+        Raises:
+            RuntimeError: If the project data cannot be fetched
+        """
+        data = self.gitlab_tool.compact_project_data(self.gitlab_tool.fetch_project_data(project))
+        if "error" in data:
+            raise RuntimeError(f"Failed to fetch GitLab project data: {data['error']}")
+
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    def _build_gathering_agents_and_tasks(self, project: str) -> Tuple[List[Agent], List[Task]]:
+        """
+        Create the optional data-gathering agents and tasks (Google Drive, RAG).
+
+        Args:
+            project: GitLab project in format 'namespace/project'
+
+        Returns:
+            Tuple of (agents, tasks), one task per agent in the same order
+        """
         agents: List[Agent] = []
         tasks: List[Task] = []
 
-        # GitLab analyzer agent and task (required)
-        gitlab_analyzer = create_gitlab_analyzer_agent(self.gpt_oss_llm, self.gitlab_tool)
-        agents.append(gitlab_analyzer)
-        tasks.append(self._create_gitlab_fetch_task(gitlab_analyzer, project))
-
         # Google Drive analyzer agent and task (optional)
         if self.enable_google_drive and self.drive_tool:
-            drive_analyzer = create_drive_analyzer_agent(self.gpt_oss_llm, self.drive_tool)
+            drive_analyzer = create_drive_analyzer_agent(self.gpt_oss_llm, self.drive_tool, verbose=self.verbose)
             agents.append(drive_analyzer)
             tasks.append(self._create_drive_search_task(drive_analyzer, project))
 
         # RAG analyzer agent and task (optional)
         if self.enable_rag and self.rag_tool:
-            rag_analyzer = create_rag_analyzer_agent(self.gpt_oss_llm, self.rag_tool)
+            rag_analyzer = create_rag_analyzer_agent(self.gpt_oss_llm, self.rag_tool, verbose=self.verbose)
             agents.append(rag_analyzer)
             tasks.append(self._create_rag_search_task(rag_analyzer, project))
 
-        # Documentation writer agent and task (required)
-        doc_writer = create_documentation_writer_agent(self.sahabat_llm)
-        agents.append(doc_writer)
-        tasks.append(self._create_documentation_writing_task(doc_writer, project))
+        # The data-gathering tasks are independent of each other, so they run
+        # concurrently; the writer waits for all of them through its context
+        for task in tasks:
+            task.async_execution = True
 
-        # Create crew with sequential process
-        crew = Crew(
-            agents=agents,
-            tasks=tasks,
-            process=Process.sequential,
-            verbose=True
+        return agents, tasks
+
+    def _build_writer_agent_and_task(
+        self,
+        project: str,
+        project_data: str,
+        context: Optional[List[Task]] = None
+    ) -> Tuple[Agent, Task]:
+        """
+        Create the documentation writer agent and its task.
+
+        Args:
+            project: GitLab project in format 'namespace/project'
+            project_data: Compact GitLab project data (JSON)
+            context: Data-gathering tasks whose output the writer uses (crew runs only)
+
+        Returns:
+            Tuple of (agent, task)
+        """
+        doc_writer = create_documentation_writer_agent(self.sahabat_llm, verbose=self.verbose)
+        write_task = self._create_documentation_writing_task(
+            doc_writer, project, context=context, project_data=project_data
         )
+        return doc_writer, write_task
 
-        logger.info("Executing crew...")
-        result = crew.kickoff()
+    def _build_agents_and_tasks(self, project: str) -> Tuple[List[Agent], List[Task]]:
+        """
+        Create the agents and tasks for a learning path run through a single Crew.
 
-        # Convert result to string and extract markdown
-        result_str = str(result)
-        markdown_content = extract_markdown_from_response(result_str)
+        The documentation writer agent and its task are always the last entries.
 
-        logger.info("Successfully generated Learning Path in Markdown format")
+        Args:
+            project: GitLab project in format 'namespace/project'
+
+        Returns:
+            Tuple of (agents, tasks) in execution order
+        """
+        # GitLab data is fetched directly (no LLM round-trip) and compacted
+        # before it reaches the writer
+        project_data = self._fetch_gitlab_context(project)
+
+        agents, tasks = self._build_gathering_agents_and_tasks(project)
+        doc_writer, write_task = self._build_writer_agent_and_task(project, project_data, context=list(tasks))
+
+        return agents + [doc_writer], tasks + [write_task]
+
+    def build_documentation_result(self, project: str, raw_output: str) -> Dict:
+        """
+        Package the writer's raw output into a learning path dictionary.
+
+        Args:
+            project: GitLab project in format 'namespace/project'
+            raw_output: Raw text produced by the writer agent
+
+        Returns:
+            Dictionary containing the generated documentation
+        """
         return {
             "project": project,
-            "documentation": markdown_content,
+            "documentation": extract_markdown_from_response(raw_output),
             "format": "markdown"
         }
 
+    def generate_documentation(self, project: str, use_crew: bool = False) -> Dict:
+        """
+        Generate documentation for a given GitLab project using collaborating agents.
+
+        The GitLab data is fetched while the data-gathering agents run, and the
+        writer is then called directly with a single completion, which skips
+        CrewAI's agent-loop prompts for the final step.
+
+        Args:
+            project: GitLab project in format 'namespace/project'
+            use_crew: Run every step, including the writer, through a single Crew
+
+        Returns:
+            Dictionary containing the generated documentation
+
+        Raises:
+            ValueError: If project format is invalid
+            RuntimeError: If the GitLab project data cannot be fetched
+        """
+        if not validate_gitlab_project(project):
+            raise ValueError(f"Invalid project format: {project}. Expected format: namespace/project")
+
+        self._log_collaboration_plan(project)
+
+        if use_crew:
+            # Create agents and tasks
+            agents, tasks = self._build_agents_and_tasks(project)
+
+            # Create crew with sequential process
+            crew = Crew(
+                agents=agents,
+                tasks=tasks,
+                process=Process.sequential,
+                verbose=self.verbose
+            )
+
+            logger.info("Executing crew...")
+            raw_output = crew.kickoff().raw
+        else:
+            messages = self._prepare_writer_messages(project)
+
+            logger.info("Calling writer LLM...")
+            raw_output = self.sahabat_llm.call(messages)
+
+        logger.info("Successfully generated Learning Path in Markdown format")
+        return self.build_documentation_result(project, raw_output)
+
+    def generate_documentation_batch(
+        self,
+        projects: List[str],
+        max_workers: int = 4
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Generate documentation for several projects concurrently.
+
+        Each project runs through generate_documentation in its own worker
+        thread, sharing this crew's tools and pooled LLM connections. Results
+        are yielded as soon as each project finishes, so they can be saved
+        without waiting for the whole batch.
+
+        Args:
+            projects: GitLab projects in format 'namespace/project'
+            max_workers: Maximum number of projects generated at the same time
+
+        Yields:
+            Tuples of (project, result), where result is the documentation
+            dictionary or a dictionary with an 'error' key if that project failed
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.generate_documentation, project): project
+                for project in projects
+            }
+            for future in as_completed(futures):
+                project = futures[future]
+                try:
+                    yield project, future.result()
+                except Exception as e:
+                    logger.error(f"Failed to generate documentation for {project}: {e}", exc_info=True)
+                    yield project, {"project": project, "error": str(e)}
+
+    def stream_documentation(self, project: str, writer_sink: Optional[TextIO] = None) -> Iterator[str]:
+        """
+        Generate documentation, streaming the writer's output as it is produced.
+
+        The GitLab data and data-gathering agents run first; the final writing
+        step is then issued directly against the writer LLM in streaming mode so
+        tokens can be rendered (and written to disk) before the full learning
+        path is complete.
+
+        Args:
+            project: GitLab project in format 'namespace/project'
+            writer_sink: Optional text stream that each chunk is written to as it arrives
+
+        Yields:
+            Text chunks of the raw learning path (pass the joined text to
+            build_documentation_result to get the final dictionary)
+
+        Raises:
+            ValueError: If project format is invalid
+            RuntimeError: If the GitLab project data cannot be fetched
+        """
+        if not validate_gitlab_project(project):
+            raise ValueError(f"Invalid project format: {project}. Expected format: namespace/project")
+
+        self._log_collaboration_plan(project)
+
+        messages = self._prepare_writer_messages(project)
+
+        logger.info("Streaming learning path from writer agent...")
+        for chunk in self.sahabat_llm.stream(messages):
+            if writer_sink is not None:
+                writer_sink.write(chunk)
+            yield chunk
+
+        logger.info("Successfully streamed Learning Path in Markdown format")
+
+    def _prepare_writer_messages(self, project: str) -> List[Dict[str, str]]:
+        """
+        Gather all inputs for the writer and build its chat messages.
+
+        Args:
+            project: GitLab project in format 'namespace/project'
+
+        Returns:
+            List of message dicts with role/content
+
+        Raises:
+            RuntimeError: If the GitLab project data cannot be fetched
+        """
+        logger.info("Fetching GitLab data and running data-gathering agents...")
+        project_data, context = self._run_data_gathering(project)
+
+        doc_writer, write_task = self._build_writer_agent_and_task(project, project_data)
+        return self._build_writer_messages(doc_writer, write_task, context)
+
+    def _run_data_gathering(self, project: str) -> Tuple[str, str]:
+        """
+        Fetch the GitLab data and run the data-gathering agents concurrently.
+
+        The GitLab fetch is plain I/O, so it overlaps with the agents' LLM turns
+        instead of delaying them. A crew may end with at most one asynchronous
+        task, so each agent runs in its own single-agent crew and everything is
+        awaited together.
+
+        Args:
+            project: GitLab project in format 'namespace/project'
+
+        Returns:
+            Tuple of (compact GitLab project data, combined agent outputs)
+
+        Raises:
+            RuntimeError: If the GitLab project data cannot be fetched
+        """
+        agents, tasks = self._build_gathering_agents_and_tasks(project)
+
+        async def run_agent(agent: Agent, task: Task):
+            # Interleaved output is attributed by tagging each record with the role
+            crew = Crew(agents=[agent], tasks=[task], process=Process.sequential, verbose=self.verbose)
+            start = time.perf_counter()
+            logger.info(f"[{agent.role}] started")
+            output = await crew.kickoff_async()
+            logger.info(f"[{agent.role}] finished in {time.perf_counter() - start:.1f}s")
+            return output
+
+        async def gather_outputs():
+            return await asyncio.gather(
+                asyncio.to_thread(self._fetch_gitlab_context, project),
+                *(run_agent(agent, task) for agent, task in zip(agents, tasks))
+            )
+
+        project_data, *outputs = asyncio.run(gather_outputs())
+        return project_data, "\n\n".join(output.raw for output in outputs)
+
+    @staticmethod
+    def _build_writer_messages(agent: Agent, task: Task, context: str) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for running the writer task outside of a crew.
+
+        Args:
+            agent: Documentation writer agent
+            task: Documentation writing task
+            context: Combined outputs of the data-gathering tasks (may be empty)
+
+        Returns:
+            List of message dicts with role/content
+        """
+        system_prompt = (
+            f"You are {agent.role}. {agent.backstory}\n"
+            f"Your personal goal is: {agent.goal}"
+        )
+        user_prompt = (
+            f"{task.description}\n\n"
+            f"This is the expected criteria for your final answer: {task.expected_output}"
+        )
+        if context:
+            user_prompt += f"\n\nThis is the context you're working with:\n{context}"
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    @staticmethod
+    def default_output_file(project: str, doc_format: str = "markdown") -> str:
+        """
+        Build the default output file name for a project's learning path.
+
+        Args:
+            project: GitLab project in format 'namespace/project'
+            doc_format: Documentation format ('markdown' or other)
+
+        Returns:
+            Output file name
+        """
+        safe_project = sanitize_filename(project.replace('/', '_'))
+        extension = ".md" if doc_format == "markdown" else ".txt"
+        return f"learning_path_{safe_project}{extension}"
+
     def save_documentation(self, documentation: Dict, output_file: Optional[str] = None) -> str:
         """
         Save learning path to a Markdown file.
@@ -461,17 +749,15 @@ class DocumentationCrew:
             Path to the saved file
         """
         if not output_file:
-            project = documentation.get("project", "unknown")
-            safe_project = sanitize_filename(project.replace('/', '_'))
-            doc_format = documentation.get("format", "markdown")
-            extension = ".md" if doc_format == "markdown" else ".txt"
-            output_file = f"learning_path_{safe_project}{extension}"
+            output_file = self.default_output_file(
+                documentation.get("project", "unknown"),
+                documentation.get("format", "markdown")
+            )
 
         # Get the documentation content
         content = documentation.get("documentation", "")
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        Path(output_file).write_text(content, encoding='utf-8')
 
         logger.info(f"Learning path saved to {output_file}")
         return output_file
@@ -500,11 +786,12 @@ class DocumentationCrew:
         logger.info(f"Searching in: {directory}/")
         logger.info("=" * 60)
 
-        # Initialize Code Q&A tool
-        code_qa_tool = GitLabCodeQATool()
+        # Initialize Code Q&A tool (once per crew)
+        if self._code_qa_tool is None:
+            self._code_qa_tool = GitLabCodeQATool()
 
         # Create Code Q&A agent with tool calling LLM
-        code_qa_agent = create_code_qa_agent(self.gpt_oss_llm, code_qa_tool)
+        code_qa_agent = create_code_qa_agent(self.gpt_oss_llm, self._code_qa_tool, verbose=self.verbose)
 
         # Create task for answering the question
         qa_task = Task(
@@ -545,14 +832,14 @@ class DocumentationCrew:
             agents=[code_qa_agent],
             tasks=[qa_task],
             process=Process.sequential,
-            verbose=True
+            verbose=self.verbose
         )
 
         logger.info("Executing Code Q&A agent...")
         result = crew.kickoff()
 
-        # Convert result to string
-        result_str = str(result)
+        # Raw text of the final task output
+        result_str = result.raw
 
         logger.info("Successfully answered code question")
         return {
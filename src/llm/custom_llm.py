@@ -1,12 +1,93 @@
 """Custom LLM implementation for GoToCompany's LiteLLM endpoint"""
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+import httpx
 import requests
-from typing import Any, List, Optional, Union, Dict
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Any, Iterator, List, Optional, Union, Dict
 from crewai.llm import BaseLLM
-
+from urllib3.util.retry import Retry
+
+from src.config.constants import (
+    LLMCacheMode,
+    DEFAULT_LLM_CACHE_DIR,
+    DEFAULT_LLM_CACHE_TTL,
+    LLM_CACHE_MAX_TEMPERATURE
+)
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Shared sync HTTP session (created lazily)
+_session: Optional[requests.Session] = None
+
+# Async HTTP clients, one per event loop (created lazily, dropped with their loop)
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for synchronous LLM calls.
+
+    The session is created once per process with a pooled adapter, so the
+    tool-calling and writing LLMs (and every crew instance) reuse the same
+    keep-alive connections to the LiteLLM endpoint.
+
+    Returns:
+        Shared requests.Session instance
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            # Retry only connection failures and 429/5xx responses; a read timeout
+            # means the endpoint may still be generating, so it is never re-sent
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=0,
+                status=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"POST"})
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Get the async HTTP client for the current event loop.
+
+    httpx connection pools cannot be shared across event loops, and batch runs
+    start one loop per worker thread, so each loop gets its own client.
+
+    Returns:
+        httpx.AsyncClient bound to the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+            _async_clients[loop] = client
+    return client
+
 
 class GoToCustomLLM(BaseLLM):
     """
@@ -22,8 +103,13 @@ class GoToCustomLLM(BaseLLM):
         endpoint: str,
         temperature: float = 0.6,
         max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
         timeout: int = 300,
-        supports_tools: bool = False
+        supports_tools: bool = False,
+        cache_mode: str = LLMCacheMode.OFF,
+        cache_dir: str = DEFAULT_LLM_CACHE_DIR,
+        cache_ttl: int = DEFAULT_LLM_CACHE_TTL,
+        prompt_caching: bool = False
     ):
         """
         Initialize the GoToCompany custom LLM.
@@ -32,46 +118,68 @@ class GoToCustomLLM(BaseLLM):
             model: The model name to use
             endpoint: The base URL of the LiteLLM proxy
             temperature: Sampling temperature (0.0-1.0)
-            max_tokens: Maximum tokens to generate
+            max_tokens: Maximum tokens to generate (None or 0 for no cap)
+            stop: Default stop sequences, sent unless a call passes its own
             timeout: Request timeout in seconds
             supports_tools: Whether this model supports function/tool calling
+            cache_mode: Response cache mode (readWrite, readOnly, writeOnly, off)
+            cache_dir: Directory for cached responses
+            cache_ttl: Time-to-live of cached responses in seconds
+            prompt_caching: Whether to mark the system prompt as a cacheable prefix
         """
         super().__init__(model=model, temperature=temperature)
 
         self.endpoint = endpoint.rstrip('/')
         self.max_tokens = max_tokens
+        self.stop = stop or []
         self.timeout = timeout
         self._supports_tools = supports_tools
+        self.cache_mode = LLMCacheMode(cache_mode)
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_ttl = cache_ttl
+        self.prompt_caching = prompt_caching
+
+        # Process-wide pooled session so keep-alive connections to the endpoint
+        # are reused across calls and across LLM instances
+        self._session = _get_session()
 
         logger.info(
             f"Initialized GoToCustomLLM: model={model}, "
             f"endpoint={endpoint}, supports_tools={supports_tools}"
         )
 
-    def call(
+    def _build_payload(
         self,
         messages: Union[str, List[Dict[str, str]]],
-        callbacks: Optional[Any] = None,
         **kwargs
-    ) -> str:
+    ) -> Dict[str, Any]:
         """
-        Make a call to the custom LLM endpoint.
+        Build the chat completion request payload.
 
         Args:
             messages: Either a string or list of message dicts with role/content
-            callbacks: Optional callbacks (not used)
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (temperature, max_tokens, stop)
 
         Returns:
-            The generated text response
-
-        Raises:
-            RuntimeError: If the API call fails
+            Request payload dictionary
         """
         # Convert string to messages format if needed
         if isinstance(messages, str):
             messages = [{"role": "user", "content": messages}]
 
+        # Tag the static system prompt so the endpoint can reuse its KV cache
+        first_message = messages[0] if messages else {}
+        if self.prompt_caching and first_message.get("role") == "system" and isinstance(first_message.get("content"), str):
+            system_message = {
+                **first_message,
+                "content": [{
+                    "type": "text",
+                    "text": first_message["content"],
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            }
+            messages = [system_message] + list(messages[1:])
+
         # Prepare the payload
         payload = {
             "model": self.model,
@@ -87,15 +195,122 @@ class GoToCustomLLM(BaseLLM):
         if "max_tokens" in kwargs:
             payload["max_tokens"] = kwargs["max_tokens"]
 
-        if "stop" in kwargs:
-            payload["stop"] = kwargs["stop"]
+        # CrewAI applies agent stop words (e.g. "\nObservation:") per call through
+        # call_stop_override, which is only visible via stop_sequences
+        stop = kwargs.get("stop") or self.stop_sequences
+        if stop:
+            payload["stop"] = stop
+
+        return payload
+
+    def _cache_path(self, payload: Dict[str, Any]) -> Optional[Path]:
+        """
+        Get the cache file for a request payload.
+
+        Args:
+            payload: Request payload dictionary
+
+        Returns:
+            Path of the cache file, or None if this request must not be cached
+        """
+        if self.cache_mode == LLMCacheMode.OFF:
+            return None
+
+        # Only near-deterministic sampling produces reusable responses
+        if payload["temperature"] > LLM_CACHE_MAX_TEMPERATURE:
+            return None
+
+        key = hashlib.md5(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _read_cache(self, cache_path: Optional[Path]) -> Optional[str]:
+        """
+        Read a cached response if present and not expired.
+
+        Args:
+            cache_path: Cache file from _cache_path
+
+        Returns:
+            The cached response text, or None on a cache miss
+        """
+        if cache_path is None or self.cache_mode not in (LLMCacheMode.READ_WRITE, LLMCacheMode.READ_ONLY):
+            return None
+
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+
+            result = json.loads(cache_path.read_text(encoding="utf-8"))
+            content = result["choices"][0]["message"]["content"]
+        except (OSError, ValueError, KeyError, IndexError):
+            return None
+
+        logger.debug(f"LLM response cache hit: {cache_path.name}")
+        return content
+
+    def _write_cache(self, cache_path: Optional[Path], result: Dict[str, Any]) -> None:
+        """
+        Atomically store a response in the cache.
+
+        Args:
+            cache_path: Cache file from _cache_path
+            result: Response JSON returned by the endpoint
+        """
+        if cache_path is None or self.cache_mode not in (LLMCacheMode.READ_WRITE, LLMCacheMode.WRITE_ONLY):
+            return
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write LLM response cache: {e}")
+
+    @staticmethod
+    def _log_cached_tokens(result: Dict[str, Any]) -> None:
+        """Log how many prompt tokens were served from the endpoint's prompt cache."""
+        usage = result.get("usage") or {}
+        cached_tokens = usage.get("cache_read_input_tokens")
+        if cached_tokens is None:
+            cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        if cached_tokens:
+            logger.debug(f"Prompt cache hit: {cached_tokens} cached input tokens")
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        callbacks: Optional[Any] = None,
+        **kwargs
+    ) -> str:
+        """
+        Make a call to the custom LLM endpoint.
+
+        Args:
+            messages: Either a string or list of message dicts with role/content
+            callbacks: Optional callbacks (not used)
+            **kwargs: Additional parameters
+
+        Returns:
+            The generated text response
+
+        Raises:
+            RuntimeError: If the API call fails
+        """
+        payload = self._build_payload(messages, **kwargs)
+
+        cache_path = self._cache_path(payload)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached
 
         # Make the request WITHOUT authorization header
         headers = {"Content-Type": "application/json"}
 
         try:
             logger.debug(f"Calling LLM endpoint: {self.endpoint}/chat/completions")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.endpoint}/chat/completions",
                 headers=headers,
                 json=payload,
@@ -105,8 +320,10 @@ class GoToCustomLLM(BaseLLM):
 
             result = response.json()
             content = result["choices"][0]["message"]["content"]
+            self._write_cache(cache_path, result)
 
             logger.debug(f"LLM response received: {len(content)} characters")
+            self._log_cached_tokens(result)
             return content
 
         except requests.exceptions.Timeout as e:
@@ -124,6 +341,153 @@ class GoToCustomLLM(BaseLLM):
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def stream(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream tokens from the custom LLM endpoint as they are generated.
+
+        Parses the server-sent events (``data: {...}`` lines) of a streaming
+        chat completion and yields each content delta.
+
+        Args:
+            messages: Either a string or list of message dicts with role/content
+            **kwargs: Additional parameters
+
+        Yields:
+            Text chunks of the generated response
+
+        Raises:
+            RuntimeError: If the API call fails
+        """
+        payload = self._build_payload(messages, **kwargs)
+        payload["stream"] = True
+        headers = {"Content-Type": "application/json"}
+
+        try:
+            logger.debug(f"Streaming from LLM endpoint: {self.endpoint}/chat/completions")
+            with self._session.post(
+                f"{self.endpoint}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+
+                    chunk = json.loads(data)
+                    choices = chunk.get("choices") or []
+                    if not choices:
+                        continue
+
+                    content = (choices[0].get("delta") or {}).get("content")
+                    if content:
+                        yield content
+
+        except requests.exceptions.Timeout as e:
+            error_msg = f"Request to {self.endpoint} timed out after {self.timeout}s"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Error streaming from GoToCompany LLM endpoint: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        except json.JSONDecodeError as e:
+            error_msg = f"Unexpected stream chunk from endpoint: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        callbacks: Optional[Any] = None,
+        **kwargs
+    ) -> str:
+        """
+        Make a non-blocking call to the custom LLM endpoint.
+
+        Crews run agents through the sync call(); CrewAI awaits acall only from
+        its async helpers (e.g. context summarization and output conversion).
+        Those calls use the event loop's httpx.AsyncClient instead of blocking it.
+
+        Args:
+            messages: Either a string or list of message dicts with role/content
+            callbacks: Optional callbacks (not used)
+            **kwargs: Additional parameters
+
+        Returns:
+            The generated text response
+
+        Raises:
+            RuntimeError: If the API call fails
+        """
+        payload = self._build_payload(messages, **kwargs)
+
+        cache_path = self._cache_path(payload)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached
+
+        headers = {"Content-Type": "application/json"}
+
+        try:
+            logger.debug(f"Calling LLM endpoint (async): {self.endpoint}/chat/completions")
+            response = await _get_async_client().post(
+                f"{self.endpoint}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+
+            result = response.json()
+            content = result["choices"][0]["message"]["content"]
+            self._write_cache(cache_path, result)
+
+            logger.debug(f"LLM response received: {len(content)} characters")
+            self._log_cached_tokens(result)
+            return content
+
+        except httpx.TimeoutException as e:
+            error_msg = f"Request to {self.endpoint} timed out after {self.timeout}s"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        except httpx.HTTPError as e:
+            error_msg = f"Error calling GoToCompany LLM endpoint: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        except (KeyError, IndexError) as e:
+            error_msg = f"Unexpected response format from endpoint: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def aclose(self) -> None:
+        """
+        Close the current event loop's async HTTP client and release its connections.
+
+        Call this before the loop ends (e.g. at the end of the coroutine passed to
+        asyncio.run). The client is shared by all instances on the loop; the next
+        acall on any of them transparently creates a new one.
+        """
+        with _async_clients_lock:
+            client = _async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
     def supports_function_calling(self) -> bool:
         """Indicate whether this LLM supports function/tool calling."""
         return self._supports_tools
@@ -137,7 +501,7 @@ class GoToCustomLLM(BaseLLM):
         return 8192
 
 
-def create_tool_calling_llm(endpoint: str, model: str, temperature: float = 0.3) -> GoToCustomLLM:
+def create_tool_calling_llm(endpoint: str, model: str, temperature: float = 0.3, **kwargs) -> GoToCustomLLM:
     """
     Factory function to create an LLM instance configured for tool calling.
 
@@ -145,6 +509,7 @@ def create_tool_calling_llm(endpoint: str, model: str, temperature: float = 0.3)
         endpoint: LLM endpoint URL
         model: Model name
         temperature: Temperature (default: 0.3 for deterministic tool calling)
+        **kwargs: Additional GoToCustomLLM options (e.g. cache settings)
 
     Returns:
         Configured GoToCustomLLM instance
@@ -153,11 +518,12 @@ def create_tool_calling_llm(endpoint: str, model: str, temperature: float = 0.3)
         model=model,
         endpoint=endpoint,
         temperature=temperature,
-        supports_tools=True
+        supports_tools=True,
+        **kwargs
     )
 
 
-def create_writing_llm(endpoint: str, model: str, temperature: float = 0.6) -> GoToCustomLLM:
+def create_writing_llm(endpoint: str, model: str, temperature: float = 0.6, **kwargs) -> GoToCustomLLM:
     """
     Factory function to create an LLM instance configured for content writing.
 
@@ -165,6 +531,7 @@ def create_writing_llm(endpoint: str, model: str, temperature: float = 0.6) -> G
         endpoint: LLM endpoint URL
         model: Model name
         temperature: Temperature (default: 0.6 for creative writing)
+        **kwargs: Additional GoToCustomLLM options (e.g. cache settings)
 
     Returns:
         Configured GoToCustomLLM instance
@@ -173,5 +540,6 @@ def create_writing_llm(endpoint: str, model: str, temperature: float = 0.6) -> G
         model=model,
         endpoint=endpoint,
         temperature=temperature,
-        supports_tools=False
+        supports_tools=False,
+        **kwargs
     )
@@ -130,7 +130,7 @@ class GitLabCodeQATool(BaseTool):
             logger.info(f"Successfully fetched {len(result['files'])} code files")
             logger.info("Agent should now analyze these files to answer the question")
 
-            return json.dumps(result, indent=2)
+            return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
 
         except Exception as e:
             error_msg = f"Error in Code Q&A tool: {str(e)}"
@@ -1,18 +1,43 @@
 """GitLab MCP Tool for CrewAI - Fetches project information from GitLab"""
 import json
+import threading
+import time
 import requests
-from typing import Any, Dict, List, Type
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
 from urllib.parse import quote_plus
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
 from src.config.settings import get_settings
+from src.config.constants import GITLAB_CACHE_TTL, GITLAB_CACHE_MAX_ENTRIES, README_MAX_BYTES
 from src.utils.logger import setup_logger
 from src.utils.validators import validate_gitlab_project
 
 logger = setup_logger(__name__)
 
 
+class _GitLabResponse(NamedTuple):
+    """Parsed GitLab response. Shared between threads through the cache, so never mutate it."""
+    status_code: int
+    text: str
+    data: Any
+    etag: Optional[str]
+
+    def json(self) -> Any:
+        """Return the parsed JSON body."""
+        if self.data is None:
+            raise ValueError(f"GitLab response (HTTP {self.status_code}) has no JSON body")
+        return self.data
+
+
+# Process-wide LRU of GitLab GET responses: (token, url, params, max_bytes) -> (fetched_at, response)
+_response_cache: Dict[Tuple, Tuple[float, _GitLabResponse]] = {}
+_response_cache_lock = threading.Lock()
+
+
 class GitLabMCPToolSchema(BaseModel):
     """Input schema for GitLabMCPTool."""
     project: str = Field(..., description="Project in format 'namespace/project' or project ID")
@@ -33,7 +58,8 @@ class GitLabMCPTool(BaseTool):
         "Use this tool for: learning path generation, project overview, contributor info, and file structure. "
         "DO NOT use this for answering specific code questions - use the Code Q&A tool for that. "
         "Input should be the project namespace and name in format 'namespace/project'. "
-        "Returns: project info, file structure, commits, README, and code snippets."
+        "Returns: project info, file structure, commits, README, and code snippets - all in ONE call, "
+        "so call this tool exactly once per project."
     )
     args_schema: Type[BaseModel] = GitLabMCPToolSchema
 
@@ -47,6 +73,15 @@ class GitLabMCPTool(BaseTool):
         object.__setattr__(self, 'gitlab_url', settings.gitlab.url)
         object.__setattr__(self, 'token', settings.gitlab.token)
         object.__setattr__(self, 'headers', {'PRIVATE-TOKEN': settings.gitlab.token})
+
+        # Pooled session with the auth header preset, so the concurrent GitLab
+        # requests reuse keep-alive connections instead of a new TLS handshake each
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        object.__setattr__(self, '_session', session)
         logger.info(f"Initialized GitLabMCPTool with URL: {settings.gitlab.url}")
 
     def _run(self, project: str) -> str:
@@ -71,43 +106,218 @@ class GitLabMCPTool(BaseTool):
             return json.dumps({"error": error_msg})
 
         try:
-            logger.info(f"Fetching GitLab project information: {project}")
+            result = self.compact_project_data(self.fetch_project_data(project))
+            return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
 
-            # Get project information
-            project_info = self._get_project_info(project)
+        except Exception as e:
+            error_msg = f"Error fetching GitLab project data: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            return json.dumps({"error": error_msg})
+
+    def fetch_project_data(self, project: str) -> Dict[str, Any]:
+        """
+        Fetch all project data used for learning path generation.
+
+        Args:
+            project: Project in format 'namespace/project' or project ID
+
+        Returns:
+            Dictionary with project info, file structure, commits, README and
+            code snippets, or a dictionary with an 'error' key
+        """
+        logger.info(f"Fetching GitLab project information: {project}")
+
+        # The GitLab requests are issued concurrently; the README and code
+        # snippets start as soon as the project info gives the default branch
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            info_future = executor.submit(self._get_project_info, project)
+            structure_future = executor.submit(self._get_file_structure, project)
+            commits_future = executor.submit(self._get_recent_commits, project, 5)
+
+            project_info = info_future.result()
 
             if "error" in project_info:
                 logger.error(f"Failed to fetch project info: {project_info['error']}")
-                return json.dumps({"error": project_info["error"]})
-
-            # Get file structure
-            file_structure = self._get_file_structure(project)
+                return {"error": project_info["error"]}
 
-            # Get recent commits
-            commits = self._get_recent_commits(project, limit=5)
+            branch = project_info.get("default_branch") or "main"
+            readme_future = executor.submit(
+                self._get_readme, project, branch, project_info.get("readme_url")
+            )
+            snippets_future = executor.submit(self._get_code_snippets, project, branch)
+
+            file_structure = structure_future.result()
+            commits = commits_future.result()
+            readme = readme_future.result()
+            code_snippets = snippets_future.result()
+
+        logger.info(f"Successfully fetched data for project: {project}")
+        return {
+            "project": project,
+            "info": project_info,
+            "file_structure": file_structure,
+            "recent_commits": commits,
+            "readme": readme,
+            "code_snippets": code_snippets
+        }
+
+    def compact_project_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce fetched project data to the fields the learning path writer uses.
 
-            # Get README
-            readme = self._get_readme(project)
+        Flattens the project info, drops fields the learning path never shows,
+        and turns the file structure into clickable links, so the LLM prompt
+        carries only what ends up in the learning path.
 
-            # Get code snippets from key files
-            code_snippets = self._get_code_snippets(project, project_info.get("default_branch", "main"))
+        Args:
+            data: Dictionary returned by fetch_project_data
 
-            result = {
-                "project": project,
-                "info": project_info,
-                "file_structure": file_structure,
-                "recent_commits": commits,
-                "readme": readme,
-                "code_snippets": code_snippets
+        Returns:
+            Dictionary with overview, structure, activity, readme and code_snippets
+        """
+        if "error" in data:
+            return {"error": data["error"]}
+
+        gitlab_url = getattr(self, 'gitlab_url')
+        project = data.get("project")
+        info = data.get("info", {})
+        branch = info.get("default_branch") or "main"
+
+        structure = []
+        for item in data.get("file_structure", {}).get("files", []):
+            kind = "tree" if item.get("type") == "tree" else "blob"
+            structure.append({
+                "path": item.get("path"),
+                "type": item.get("type"),
+                "link": f"{gitlab_url}/{project}/-/{kind}/{branch}/{item.get('path')}"
+            })
+
+        activity = [
+            {
+                "title": commit.get("title"),
+                "author": commit.get("author_name"),
+                "date": commit.get("authored_date"),
+                "link": commit.get("web_url")
             }
+            for commit in data.get("recent_commits", [])
+            if "error" not in commit
+        ]
+
+        return {
+            "overview": {
+                "name": info.get("name"),
+                "description": info.get("description"),
+                "url": info.get("web_url"),
+                "default_branch": branch,
+                "license": info.get("license"),
+                "visibility": info.get("visibility"),
+                "topics": info.get("topics", []),
+                "stars": info.get("star_count"),
+                "forks": info.get("forks_count"),
+                "open_issues": info.get("open_issues_count"),
+                "last_activity_at": info.get("last_activity_at")
+            },
+            "structure": structure,
+            "activity": activity,
+            "readme": data.get("readme"),
+            "code_snippets": data.get("code_snippets", {})
+        }
+
+    def _cached_get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: int = 30,
+        max_bytes: Optional[int] = None,
+        cache_not_found: bool = False
+    ) -> _GitLabResponse:
+        """
+        Send a GET request through the process-wide GitLab response cache.
 
-            logger.info(f"Successfully fetched data for project: {project}")
-            return json.dumps(result, indent=2)
+        Fresh entries are returned without a request. Stale entries that carry
+        an ETag are revalidated with If-None-Match, and a 304 reuses the cached
+        body. Only 200 responses are cached, plus 404s when cache_not_found is
+        set (README and key file probes), so errors and projects that were just
+        created or shared are retried on the next call. The token is part of the
+        key so users never see each other's data.
 
-        except Exception as e:
-            error_msg = f"Error fetching GitLab project data: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return json.dumps({"error": error_msg})
+        With max_bytes set, the body is streamed and only its first max_bytes + 1
+        bytes are downloaded (one extra byte tells the caller it was truncated).
+
+        Args:
+            url: GitLab API URL
+            params: Query parameters
+            timeout: Request timeout in seconds
+            max_bytes: Maximum number of body bytes to download (optional)
+            cache_not_found: Whether to cache a 404 response
+
+        Returns:
+            The (possibly cached) parsed response
+        """
+        key = (getattr(self, 'token'), url, tuple(sorted((params or {}).items())), max_bytes)
+        now = time.monotonic()
+
+        with _response_cache_lock:
+            cached = _response_cache.pop(key, None)
+            if cached:
+                # Re-insert as most recently used
+                _response_cache[key] = cached
+
+        headers = {}
+        if cached:
+            fetched_at, cached_response = cached
+            if now - fetched_at < GITLAB_CACHE_TTL:
+                logger.debug(f"GitLab cache hit: {url}")
+                return cached_response
+            if cached_response.etag:
+                headers["If-None-Match"] = cached_response.etag
+
+        if max_bytes is None:
+            raw_response = self._session.get(url, params=params, headers=headers, timeout=timeout)
+            text = raw_response.text
+        else:
+            raw_response = self._session.get(url, params=params, headers=headers, timeout=timeout, stream=True)
+            try:
+                # Closing the response early drops the rest of the body unread
+                body = raw_response.raw.read(max_bytes + 1, decode_content=True)
+            except urllib3.exceptions.HTTPError as e:
+                raise requests.exceptions.ConnectionError(e) from e
+            finally:
+                raw_response.close()
+            text = body.decode(raw_response.encoding or "utf-8", errors="replace")
+
+        if raw_response.status_code == 304 and cached:
+            logger.debug(f"GitLab cache revalidated: {url}")
+            response = cached[1]
+        else:
+            data = None
+            if raw_response.status_code == 200 and "json" in raw_response.headers.get("Content-Type", ""):
+                data = json.loads(text)
+            response = _GitLabResponse(raw_response.status_code, text, data, raw_response.headers.get("ETag"))
+
+        if response.status_code == 200 or (response.status_code == 404 and cache_not_found):
+            with _response_cache_lock:
+                _response_cache.pop(key, None)
+                _response_cache[key] = (now, response)
+                while len(_response_cache) > GITLAB_CACHE_MAX_ENTRIES:
+                    del _response_cache[next(iter(_response_cache))]
+
+        return response
+
+    def _project_api_url(self, project: str) -> str:
+        """
+        Build the GitLab API base URL of a project.
+
+        Surrounding slashes are stripped, so equivalent project strings share
+        the same URL (and response cache entries).
+
+        Args:
+            project: Project identifier
+
+        Returns:
+            URL of the form <gitlab_url>/api/v4/projects/<encoded project>
+        """
+        return f"{getattr(self, 'gitlab_url')}/api/v4/projects/{quote_plus(project.strip('/'))}"
 
     def _get_project_info(self, project: str) -> Dict[str, Any]:
         """
@@ -120,21 +330,15 @@ class GitLabMCPTool(BaseTool):
             Dictionary with project information
         """
         try:
-            gitlab_url = getattr(self, 'gitlab_url')
-            headers = getattr(self, 'headers')
-            project_encoded = quote_plus(project)
-            url = f'{gitlab_url}/api/v4/projects/{project_encoded}'
+            url = self._project_api_url(project)
 
             logger.debug(f"Fetching project info from: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._cached_get(url, timeout=30)
 
             if response.status_code == 200:
                 data = response.json()
                 return {
-                    "id": data.get("id"),
                     "name": data.get("name"),
-                    "path": data.get("path"),
-                    "path_with_namespace": data.get("path_with_namespace"),
                     "description": data.get("description"),
                     "default_branch": data.get("default_branch"),
                     "visibility": data.get("visibility"),
@@ -142,7 +346,6 @@ class GitLabMCPTool(BaseTool):
                     "forks_count": data.get("forks_count"),
                     "open_issues_count": data.get("open_issues_count"),
                     "topics": data.get("topics", []),
-                    "created_at": data.get("created_at"),
                     "last_activity_at": data.get("last_activity_at"),
                     "web_url": data.get("web_url"),
                     "readme_url": data.get("readme_url"),
@@ -169,15 +372,12 @@ class GitLabMCPTool(BaseTool):
             Dictionary with file structure
         """
         try:
-            gitlab_url = getattr(self, 'gitlab_url')
-            headers = getattr(self, 'headers')
-            project_encoded = quote_plus(project)
-            url = f'{gitlab_url}/api/v4/projects/{project_encoded}/repository/tree'
+            project_url = self._project_api_url(project)
+            url = f'{project_url}/repository/tree'
 
             logger.debug(f"Fetching file structure from: {url}")
-            response = requests.get(
+            response = self._cached_get(
                 url,
-                headers=headers,
                 params={'path': path, 'per_page': 20},
                 timeout=30
             )
@@ -189,8 +389,7 @@ class GitLabMCPTool(BaseTool):
                     structure.append({
                         "name": item.get("name"),
                         "path": item.get("path"),
-                        "type": item.get("type"),
-                        "mode": item.get("mode")
+                        "type": item.get("type")
                     })
                 return {"files": structure}
             else:
@@ -213,15 +412,12 @@ class GitLabMCPTool(BaseTool):
             List of commit dictionaries
         """
         try:
-            gitlab_url = getattr(self, 'gitlab_url')
-            headers = getattr(self, 'headers')
-            project_encoded = quote_plus(project)
-            url = f'{gitlab_url}/api/v4/projects/{project_encoded}/repository/commits'
+            project_url = self._project_api_url(project)
+            url = f'{project_url}/repository/commits'
 
             logger.debug(f"Fetching recent commits from: {url}")
-            response = requests.get(
+            response = self._cached_get(
                 url,
-                headers=headers,
                 params={'per_page': limit},
                 timeout=30
             )
@@ -231,10 +427,8 @@ class GitLabMCPTool(BaseTool):
                 commits = []
                 for commit in data:
                     commits.append({
-                        "id": commit.get("id", "")[:7],
                         "short_id": commit.get("short_id", ""),
                         "title": commit.get("title", ""),
-                        "message": commit.get("message", ""),
                         "author_name": commit.get("author_name", ""),
                         "authored_date": commit.get("authored_date", ""),
                         "web_url": commit.get("web_url", "")
@@ -248,43 +442,51 @@ class GitLabMCPTool(BaseTool):
             logger.error(f"Request error fetching commits: {e}")
             return [{"error": str(e)}]
 
-    def _get_readme(self, project: str) -> str:
+    def _get_readme(self, project: str, branch: str = "main", readme_url: Optional[str] = None) -> str:
         """
         Get project README.
 
+        The README path is taken from the project's readme_url, so a single
+        request fetches it; the common README filenames on the default branch
+        are only probed when GitLab did not report one.
+
         Args:
             project: Project identifier
+            branch: Default branch of the project
+            readme_url: README web URL from the project info (optional)
 
         Returns:
             README content (truncated to 1000 chars)
         """
         try:
-            gitlab_url = getattr(self, 'gitlab_url')
-            headers = getattr(self, 'headers')
-            project_encoded = quote_plus(project)
-            readme_filenames = ['README.md', 'README', 'readme.md', 'Readme.md']
+            project_url = self._project_api_url(project)
+
+            # readme_url has the form <web_url>/-/blob/<branch>/<path>
+            blob_marker = f"/-/blob/{branch}/"
+            if readme_url and blob_marker in readme_url:
+                readme_filenames = [readme_url.split(blob_marker, 1)[1]]
+            else:
+                readme_filenames = ['README.md', 'README', 'readme.md', 'Readme.md']
 
             for filename in readme_filenames:
                 file_encoded = quote_plus(filename)
+                url = f'{project_url}/repository/files/{file_encoded}/raw'
 
-                # Try main branch first
-                for branch in ['main', 'master']:
-                    url = f'{gitlab_url}/api/v4/projects/{project_encoded}/repository/files/{file_encoded}/raw'
-
-                    logger.debug(f"Trying to fetch README: {filename} on branch {branch}")
-                    response = requests.get(
-                        url,
-                        headers=headers,
-                        params={'ref': branch},
-                        timeout=30
-                    )
-
-                    if response.status_code == 200:
-                        content = response.text[:1000]
-                        if len(response.text) > 1000:
-                            content += "..."
-                        logger.info(f"Successfully fetched README: {filename}")
-                        return content
+                logger.debug(f"Trying to fetch README: {filename} on branch {branch}")
+                response = self._cached_get(
+                    url,
+                    params={'ref': branch},
+                    timeout=30,
+                    max_bytes=README_MAX_BYTES,
+                    cache_not_found=True
+                )
+
+                if response.status_code == 200:
+                    content = response.text[:1000]
+                    if len(response.text) > 1000:
+                        content += "..."
+                    logger.info(f"Successfully fetched README: {filename}")
+                    return content
 
             logger.warning("README not found in repository")
             return "README not found or inaccessible"
@@ -306,8 +508,7 @@ class GitLabMCPTool(BaseTool):
         """
         try:
             gitlab_url = getattr(self, 'gitlab_url')
-            headers = getattr(self, 'headers')
-            project_encoded = quote_plus(project)
+            project_url = self._project_api_url(project)
 
             # Key files to fetch (in priority order)
             key_files = [
@@ -326,14 +527,14 @@ class GitLabMCPTool(BaseTool):
 
             for filename in key_files:
                 file_encoded = quote_plus(filename)
-                url = f'{gitlab_url}/api/v4/projects/{project_encoded}/repository/files/{file_encoded}/raw'
+                url = f'{project_url}/repository/files/{file_encoded}/raw'
 
                 logger.debug(f"Trying to fetch code snippet: {filename}")
-                response = requests.get(
+                response = self._cached_get(
                     url,
-                    headers=headers,
                     params={'ref': branch},
-                    timeout=30
+                    timeout=30,
+                    cache_not_found=True
                 )
 
                 if response.status_code == 200:
@@ -382,16 +583,14 @@ class GitLabMCPTool(BaseTool):
         """
         try:
             gitlab_url = getattr(self, 'gitlab_url')
-            headers = getattr(self, 'headers')
-            project_encoded = quote_plus(project)
+            project_url = self._project_api_url(project)
 
             # Get directory tree recursively
-            url = f'{gitlab_url}/api/v4/projects/{project_encoded}/repository/tree'
+            url = f'{project_url}/repository/tree'
 
             logger.info(f"Fetching code files from {directory}/ directory")
-            response = requests.get(
+            response = self._cached_get(
                 url,
-                headers=headers,
                 params={'path': directory, 'recursive': True, 'per_page': 100, 'ref': branch},
                 timeout=30
             )
@@ -422,12 +621,11 @@ class GitLabMCPTool(BaseTool):
 
                 # Fetch file content
                 file_encoded = quote_plus(file_path)
-                file_url = f'{gitlab_url}/api/v4/projects/{project_encoded}/repository/files/{file_encoded}/raw'
+                file_url = f'{project_url}/repository/files/{file_encoded}/raw'
 
                 logger.debug(f"Fetching code file: {file_path}")
-                file_response = requests.get(
+                file_response = self._cached_get(
                     file_url,
-                    headers=headers,
                     params={'ref': branch},
                     timeout=30
                 )
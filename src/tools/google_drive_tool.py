@@ -1,6 +1,7 @@
 """Google Drive MCP Tool for CrewAI - Searches and retrieves Google Drive documents"""
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
@@ -151,30 +152,35 @@ class GoogleDriveMCPTool(BaseTool):
                     "message": f"No files found matching '{query}'"
                 })
 
-            # Get content of first few files (limit to prevent overload)
+            # Get content of first few files (limit to prevent overload).
+            # Each get_file call is an independent round-trip to the MCP
+            # server, so they are issued concurrently.
+            selected = [file_info for file_info in files[:self.top_k] if file_info.get("uri")]
+            logger.debug(f"Retrieving {len(selected)} files")
+            with ThreadPoolExecutor(max_workers=max(len(selected), 1)) as executor:
+                file_contents = list(executor.map(
+                    lambda file_info: self._get_file(file_info["uri"]), selected
+                ))
+
             results = []
-            for file_info in files[:self.top_k]:
+            for file_info, file_content in zip(selected, file_contents):
                 file_uri = file_info.get("uri")
                 file_name = file_info.get("name")
                 mime_type = file_info.get("mimeType", "")
-
-                if file_uri:
-                    logger.debug(f"Retrieving file: {file_name}")
-                    file_content = self._get_file(file_uri)
-                    content = file_content.get("content", "")
-
-                    # Convert URI to clickable URL
-                    clickable_url = self._convert_uri_to_url(file_uri, mime_type)
-
-                    results.append({
-                        "name": file_name,
-                        "uri": file_uri,
-                        "url": clickable_url,  # Add clickable URL
-                        "mimeType": mime_type,
-                        "content": content[:2000],  # Limit to first 2000 chars
-                        "full_content_length": len(content)
-                    })
-                    logger.info(f"Converted {file_name} URI to URL: {clickable_url}")
+                content = file_content.get("content", "")
+
+                # Convert URI to clickable URL
+                clickable_url = self._convert_uri_to_url(file_uri, mime_type)
+
+                results.append({
+                    "name": file_name,
+                    "uri": file_uri,
+                    "url": clickable_url,  # Add clickable URL
+                    "mimeType": mime_type,
+                    "content": content[:2000],  # Limit to first 2000 chars
+                    "full_content_length": len(content)
+                })
+                logger.info(f"Converted {file_name} URI to URL: {clickable_url}")
 
             logger.info(f"Retrieved {len(results)} files from Google Drive")
             return json.dumps({
@@ -182,7 +188,7 @@ class GoogleDriveMCPTool(BaseTool):
                 "files_found": len(files),
                 "files_retrieved": len(results),
                 "files": results
-            }, indent=2)
+            }, ensure_ascii=False, separators=(",", ":"))
 
         except Exception as e:
             error_msg = f"Error searching Google Drive: {str(e)}"
@@ -1,22 +1,210 @@
 """RAG Milvus Tool for CrewAI - Semantic search across internal knowledge base"""
 import os
 import json
+import math
+import threading
+import time
 import requests
-from typing import Any, Dict, List, Type
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional, Tuple, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
-from pymilvus import MilvusClient
+from urllib3.util.retry import Retry
 
 from src.config.settings import get_settings
 from src.config.constants import (
     RAG_COLLECTION_NAME,
     DEFAULT_RAG_TOP_K,
-    DEFAULT_EMBEDDING_TIMEOUT
+    DEFAULT_EMBEDDING_TIMEOUT,
+    EMBEDDING_BATCH_MAX_SIZE,
+    EMBEDDING_BATCH_WAIT_MS,
+    RAG_CACHE_TTL,
+    RAG_CACHE_MAX_ENTRIES,
+    RAG_MIN_QUERY_CHARS,
+    RAG_MAX_QUERY_CHARS,
+    RAG_SEMANTIC_CACHE_THRESHOLD,
+    RAG_SEMANTIC_CACHE_MAX_ENTRIES
 )
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Process-wide LRU of query embeddings: (endpoint, model, embedded text) -> vector
+_embedding_cache: Dict[Tuple[str, str, str], List[float]] = {}
+# Process-wide cache of search results: (db_path, model, top_k, search knobs, query) -> (stored_at, result)
+_search_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+# Process-wide semantic cache: (db_path, model, top_k, search knobs) -> [(stored_at, unit vector, result)]
+_semantic_cache: Dict[Tuple, List[Tuple[float, List[float], Dict[str, Any]]]] = {}
+_cache_lock = threading.Lock()
+
+# Shared HTTP session for the embedding endpoint (created lazily)
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Attempts per embedding request (first try plus retries of the session's Retry)
+_EMBEDDING_ATTEMPTS = 3
+# Longest a batch flush can take: every attempt hits both the connect and the
+# read timeout, plus the retry backoff and the batching window
+_EMBEDDING_BATCH_TIMEOUT = _EMBEDDING_ATTEMPTS * 2 * DEFAULT_EMBEDDING_TIMEOUT + 5
+
+
+def _get_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for embedding requests.
+
+    Keep-alive connections are pooled per process, so only the first query
+    pays for the TCP and TLS handshake.
+
+    Returns:
+        Shared requests.Session instance
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                # Read timeouts are not retried, so a request is bounded by one timeout
+                max_retries=Retry(
+                    total=_EMBEDDING_ATTEMPTS - 1,
+                    connect=_EMBEDDING_ATTEMPTS - 1,
+                    read=0,
+                    status=_EMBEDDING_ATTEMPTS - 1,
+                    backoff_factor=0.2,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset({"POST"}),
+                    # A long Retry-After would outlast the batch timeout
+                    respect_retry_after_header=False
+                )
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+class _EmbeddingBatcher:
+    """
+    Coalesce concurrent embedding requests into one call to the endpoint.
+
+    The first query opens a short window. Queries arriving before it closes
+    are sent together with list input, and each caller's Future receives
+    its own vector. A full batch is flushed immediately.
+    """
+
+    def __init__(self, endpoint: str, model_name: str):
+        self.endpoint = endpoint
+        self.model_name = model_name
+        # Static parts of every request, built once
+        self._payload_template = {"model": model_name, "encoding_format": "float"}
+        self._headers = {"Content-Type": "application/json"}
+        self._pending: List[Tuple[str, Future]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> List[float]:
+        """
+        Queue a text for the next batch and wait for its embedding.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+
+        Raises:
+            TimeoutError: If the batch does not complete within the worst-case flush time
+        """
+        future: Future = Future()
+        flush_now = False
+        with self._lock:
+            self._pending.append((text, future))
+            if len(self._pending) >= EMBEDDING_BATCH_MAX_SIZE:
+                flush_now = True
+            elif self._timer is None:
+                self._timer = threading.Timer(EMBEDDING_BATCH_WAIT_MS / 1000, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self._flush()
+        try:
+            return future.result(timeout=_EMBEDDING_BATCH_TIMEOUT)
+        except FutureTimeoutError:
+            raise TimeoutError(
+                f"Embedding batch did not complete within {_EMBEDDING_BATCH_TIMEOUT}s"
+            ) from None
+
+    def _flush(self) -> None:
+        """Send all pending texts in one request and resolve their futures."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not batch:
+            return
+
+        texts = [text for text, _ in batch]
+        # A single query keeps the plain string input
+        payload = {**self._payload_template, "input": texts[0] if len(texts) == 1 else texts}
+
+        try:
+            logger.debug(f"Requesting {len(texts)} embedding(s) in one batch")
+            response = _get_session().post(
+                self.endpoint,
+                json=payload,
+                headers=self._headers,
+                timeout=DEFAULT_EMBEDDING_TIMEOUT
+            )
+            response.raise_for_status()
+            data = sorted(response.json()["data"], key=lambda item: item.get("index", 0))
+            if len(data) != len(batch):
+                raise ValueError(f"expected {len(batch)} embeddings, got {len(data)}")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), item in zip(batch, data):
+            future.set_result(item["embedding"])
+
+
+# One batcher per (endpoint, model)
+_batchers: Dict[Tuple[str, str], _EmbeddingBatcher] = {}
+
+
+def _get_batcher(endpoint: str, model_name: str) -> _EmbeddingBatcher:
+    """Get the shared embedding batcher for an endpoint and model."""
+    with _cache_lock:
+        batcher = _batchers.get((endpoint, model_name))
+        if batcher is None:
+            batcher = _EmbeddingBatcher(endpoint, model_name)
+            _batchers[(endpoint, model_name)] = batcher
+    return batcher
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace and case so trivially different queries share cache entries."""
+    return " ".join(query.split()).lower()
+
+
+def _unit_vector(vector: List[float]) -> List[float]:
+    """Scale a vector to unit length so a dot product gives cosine similarity."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+def _cache_put(cache: Dict, key: Tuple, value: Any) -> None:
+    """Insert a cache entry as most recent, evicting the oldest beyond the size limit."""
+    with _cache_lock:
+        cache.pop(key, None)
+        cache[key] = value
+        while len(cache) > RAG_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+
 
 class RAGMilvusToolSchema(BaseModel):
     """Input schema for RAGMilvusTool."""
@@ -51,6 +239,10 @@ class RAGMilvusTool(BaseTool):
     model_name: str = ""
     embedding_endpoint: str = ""
     top_k: int = DEFAULT_RAG_TOP_K
+    semantic_cache_enabled: bool = False
+    metric_type: str = ""
+    ef_search: int = 0
+    nprobe: int = 0
 
     class Config:
         arbitrary_types_allowed = True
@@ -61,6 +253,10 @@ class RAGMilvusTool(BaseTool):
         model_name: str = None,
         embedding_endpoint: str = None,
         top_k: int = None,
+        metric_type: str = None,
+        ef_search: int = None,
+        nprobe: int = None,
+        semantic_cache_enabled: bool = None,
         **kwargs
     ):
         """
@@ -71,6 +267,10 @@ class RAGMilvusTool(BaseTool):
             model_name: Embedding model name (optional, reads from settings)
             embedding_endpoint: URL for embedding generation (optional, reads from settings)
             top_k: Number of top results to return (optional, default from settings)
+            metric_type: Search metric, e.g. COSINE or IP (optional, default: the index's own)
+            ef_search: HNSW search breadth; lower is faster, higher is more accurate (optional, 0 = index default)
+            nprobe: IVF clusters to probe (optional, 0 = index default)
+            semantic_cache_enabled: Reuse results of near-identical earlier queries (optional, default from settings)
         """
         settings = get_settings()
 
@@ -80,11 +280,18 @@ class RAGMilvusTool(BaseTool):
             model_name=model_name or settings.rag.embedding_model,
             embedding_endpoint=embedding_endpoint or settings.rag.embedding_endpoint,
             top_k=top_k or settings.rag.top_k,
+            metric_type=metric_type or settings.rag.metric_type,
+            ef_search=ef_search or settings.rag.ef_search,
+            nprobe=nprobe or settings.rag.nprobe,
+            semantic_cache_enabled=(
+                settings.rag.semantic_cache if semantic_cache_enabled is None else semantic_cache_enabled
+            ),
             **kwargs
         )
 
         object.__setattr__(self, '_initialized', False)
         object.__setattr__(self, '_client', None)
+        object.__setattr__(self, '_collection_loaded', False)
 
         # Initialize Milvus client
         self._initialize_client()
@@ -96,6 +303,9 @@ class RAGMilvusTool(BaseTool):
                 logger.warning(f"Milvus database not found at {self.db_path}")
                 return
 
+            # Imported here: pymilvus is heavy (gRPC, protobuf, numpy) and only
+            # needed once knowledge base search is enabled
+            from pymilvus import MilvusClient
             client = MilvusClient(self.db_path)
             object.__setattr__(self, '_client', client)
             logger.info(f"RAG Milvus client initialized with database: {self.db_path}")
@@ -107,10 +317,88 @@ class RAGMilvusTool(BaseTool):
         """Check if RAG tool is available."""
         return getattr(self, '_initialized', False)
 
+    def _search_params(self) -> Dict[str, Any]:
+        """
+        Build Milvus search params from the configured knobs.
+
+        Unset knobs are left out so the collection's index defaults apply.
+
+        Returns:
+            Search params dictionary (empty when nothing is configured)
+        """
+        params: Dict[str, Any] = {}
+        if self.ef_search:
+            params["ef"] = max(self.ef_search, self.top_k)
+        if self.nprobe:
+            params["nprobe"] = self.nprobe
+
+        search_params: Dict[str, Any] = {}
+        if self.metric_type:
+            search_params["metric_type"] = self.metric_type
+        if params:
+            search_params["params"] = params
+        return search_params
+
+    def _load_collection(self) -> None:
+        """Load the collection into memory so the first search skips the cold load."""
+        try:
+            self._client.load_collection(RAG_COLLECTION_NAME)
+            object.__setattr__(self, '_collection_loaded', True)
+        except Exception as e:
+            # Not fatal: search loads on demand and reports real errors itself
+            logger.warning(f"Failed to pre-load collection {RAG_COLLECTION_NAME}: {e}")
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop all cached embeddings and search results."""
+        with _cache_lock:
+            _embedding_cache.clear()
+            _search_cache.clear()
+            _semantic_cache.clear()
+
+    @staticmethod
+    def _semantic_lookup(scope: Tuple, unit_vector: List[float]) -> Optional[Dict[str, Any]]:
+        """
+        Find a fresh cached result whose query embedding is close enough to this one.
+
+        Args:
+            scope: Search configuration the result must have been produced with
+            unit_vector: Normalized query embedding
+
+        Returns:
+            The most similar cached result at or above the threshold, or None
+        """
+        now = time.monotonic()
+        with _cache_lock:
+            entries = list(_semantic_cache.get(scope, ()))
+
+        best_score, best_result = RAG_SEMANTIC_CACHE_THRESHOLD, None
+        for stored_at, cached_vector, result in entries:
+            if now - stored_at >= RAG_CACHE_TTL:
+                continue
+            score = sum(a * b for a, b in zip(unit_vector, cached_vector))
+            if score >= best_score:
+                best_score, best_result = score, result
+        if best_result is not None:
+            logger.info(f"Semantic cache hit (cosine similarity {best_score:.3f})")
+        return best_result
+
+    @staticmethod
+    def _semantic_store(scope: Tuple, unit_vector: List[float], result: Dict[str, Any]) -> None:
+        """Remember a search result, dropping the oldest entries beyond the size limit."""
+        with _cache_lock:
+            entries = _semantic_cache.setdefault(scope, [])
+            entries.append((time.monotonic(), unit_vector, result))
+            del entries[:-RAG_SEMANTIC_CACHE_MAX_ENTRIES]
+
     def _generate_embedding(self, text: str) -> List[float]:
         """
         Generate embedding vector for the given text.
 
+        Vectors are cached per endpoint and model, so a repeated query skips
+        the embedding request. Misses go through the shared batcher, so
+        concurrent searches (e.g. batch documentation runs) share a request.
+
         Args:
             text: Text to embed
 
@@ -120,24 +408,20 @@ class RAGMilvusTool(BaseTool):
         Raises:
             RuntimeError: If embedding generation fails
         """
-        payload = {
-            "model": self.model_name,
-            "input": text,
-            "encoding_format": "float"
-        }
-        headers = {"Content-Type": "application/json"}
+        key = (self.embedding_endpoint, self.model_name, text)
+        with _cache_lock:
+            embedding = _embedding_cache.pop(key, None)
+            if embedding is not None:
+                _embedding_cache[key] = embedding
+        if embedding is not None:
+            logger.debug(f"Embedding cache hit for query: {text[:50]}...")
+            return embedding
 
         try:
             logger.debug(f"Generating embedding for query: {text[:50]}...")
-            response = requests.post(
-                self.embedding_endpoint,
-                json=payload,
-                headers=headers,
-                timeout=DEFAULT_EMBEDDING_TIMEOUT
-            )
-            response.raise_for_status()
-            embedding = response.json()["data"][0]["embedding"]
+            embedding = _get_batcher(self.embedding_endpoint, self.model_name).embed(text)
             logger.debug(f"Successfully generated embedding: {len(embedding)} dimensions")
+            _cache_put(_embedding_cache, key, embedding)
             return embedding
         except Exception as e:
             error_msg = f"Failed to generate embedding: {str(e)}"
@@ -148,9 +432,6 @@ class RAGMilvusTool(BaseTool):
         """
         Search the knowledge base for relevant information.
 
-        The database uses a single 'combined_item' collection with a 'source' field
-        to indicate the origin of each document.
-
         Args:
             query: Natural language search query
 
@@ -163,59 +444,122 @@ class RAGMilvusTool(BaseTool):
         logger.info("This is the RAG tool, NOT the GitLab tool!")
         logger.info("=" * 80)
 
+        return json.dumps(self._search(query), ensure_ascii=False, separators=(",", ":"))
+
+    def _search(self, query: str) -> Dict[str, Any]:
+        """
+        Search the knowledge base and return the structured result.
+
+        The database uses a single 'combined_item' collection with a 'source' field
+        to indicate the origin of each document. Successful results are cached
+        for RAG_CACHE_TTL seconds, keyed by the normalized query. With the
+        semantic cache enabled, a query whose embedding is close enough to an
+        earlier one reuses that result instead of searching. Returned dicts may
+        be shared with the cache and must not be modified.
+
+        Args:
+            query: Natural language search query
+
+        Returns:
+            Dictionary with search results, or with an 'error' key on failure
+        """
         if not self.is_available():
             error_msg = "RAG Milvus tool not available. Check database path and initialization."
             logger.error(error_msg)
-            return json.dumps({"error": error_msg})
+            return {"error": error_msg}
+
+        # The embedding sees the agent's query as written (case preserved);
+        # the case-folded form is only used to key the result cache
+        embed_text = " ".join(query.split())[:RAG_MAX_QUERY_CHARS]
+        normalized_query = _normalize_query(embed_text)
+        if len(normalized_query) < RAG_MIN_QUERY_CHARS:
+            logger.warning(f"Query too short to search: {query!r}")
+            return {
+                "query": query,
+                "collection": RAG_COLLECTION_NAME,
+                "results_count": 0,
+                "sources_found": [],
+                "results": [],
+                "note": "query too short"
+            }
+
+        cache_key = (
+            self.db_path, self.model_name, self.top_k,
+            self.metric_type, self.ef_search, self.nprobe, normalized_query
+        )
+        with _cache_lock:
+            cached = _search_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < RAG_CACHE_TTL:
+            logger.info("Returning cached knowledge base results")
+            # The key is case/whitespace-folded, so echo this caller's wording
+            return {**cached[1], "query": query}
 
         try:
             logger.info(f"Searching knowledge base for: {query}")
 
-            # Generate embedding for query
-            query_vector = self._generate_embedding(query)
-
             # Get Milvus client
             client = getattr(self, '_client', None)
             if not client:
                 raise RuntimeError("Milvus client not initialized")
 
+            # Generate embedding for query, loading the collection alongside it on first use
+            if getattr(self, '_collection_loaded', False):
+                query_vector = self._generate_embedding(embed_text)
+            else:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    load_future = executor.submit(self._load_collection)
+                    embed_future = executor.submit(self._generate_embedding, embed_text)
+                    load_future.result()
+                    query_vector = embed_future.result()
+
+            scope = cache_key[:-1]
+            unit_vector = _unit_vector(query_vector) if self.semantic_cache_enabled else None
+            if unit_vector is not None:
+                cached_result = self._semantic_lookup(scope, unit_vector)
+                if cached_result is not None:
+                    result = {**cached_result, "query": query}
+                    _cache_put(_search_cache, cache_key, (time.monotonic(), result))
+                    return result
+
             # Search the combined collection
             logger.info(f"Searching collection: {RAG_COLLECTION_NAME}")
             search_results = client.search(
                 collection_name=RAG_COLLECTION_NAME,
                 data=[query_vector],
                 limit=self.top_k,
-                output_fields=["text", "source"]  # Include source field
+                output_fields=["text", "source"],  # Include source field
+                search_params=self._search_params()
             )
 
             # Format results
-            results = []
-            sources = set()
-
-            for hit in search_results[0]:
-                source = hit["entity"].get("source", "N/A")
-                sources.add(source)
-
-                results.append({
+            results = [
+                {
                     "score": float(hit["distance"]),
                     "text": hit["entity"]["text"],
-                    "source": source
-                })
+                    "source": hit["entity"].get("source", "N/A")
+                }
+                for hit in search_results[0]
+            ]
+            sources = {result["source"] for result in results}
 
             logger.info(f"Found {len(results)} results from {len(sources)} different sources")
 
-            return json.dumps({
+            result = {
                 "query": query,
                 "collection": RAG_COLLECTION_NAME,
                 "results_count": len(results),
-                "sources_found": sorted(list(sources)),
+                "sources_found": sorted(sources),
                 "results": results
-            }, indent=2)
+            }
+            _cache_put(_search_cache, cache_key, (time.monotonic(), result))
+            if unit_vector is not None:
+                self._semantic_store(scope, unit_vector, result)
+            return result
 
         except Exception as e:
             error_msg = f"Error searching knowledge base: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            return json.dumps({
+            return {
                 "error": error_msg,
                 "query": query
-            })
+            }
@@ -0,0 +1,55 @@
+"""File writing utilities"""
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, TextIO, Union
+
+
+def _target_mode(path: Path) -> int:
+    """
+    Get the permission bits a file written to path should end up with.
+
+    Args:
+        path: Destination file path
+
+    Returns:
+        The existing file's mode, or the default mode for new files (0o666 minus the umask)
+    """
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        # The umask can only be read by setting it, so restore it right away
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+@contextmanager
+def atomic_write(path: Union[str, Path], encoding: str = 'utf-8', buffering: int = -1) -> Iterator[TextIO]:
+    """
+    Open a temporary file that replaces path only if the block completes.
+
+    The temporary file lives in the destination directory so the final
+    os.replace is atomic. It gets the existing file's permissions (or the usual
+    permissions of a new file) instead of mkstemp's owner-only 0600, and it is
+    removed if the block raises, leaving any existing file untouched.
+
+    Args:
+        path: Destination file path
+        encoding: Text encoding
+        buffering: Buffer size passed to open()
+
+    Yields:
+        Writable text file object
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, buffering=buffering) as f:
+            yield f
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -1,8 +1,15 @@
 """Input validation utilities"""
 import re
+from functools import lru_cache
 from typing import Optional
 
+# GitLab project format: namespace/project or namespace/subgroup/project
+_GITLAB_PROJECT_RE = re.compile(r'^[\w\-\.]+(/[\w\-\.]+)+$')
+_URL_RE = re.compile(r'^https?://[\w\-\.]+(:\d+)?(/.*)?$')
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
 
+
+@lru_cache(maxsize=256)
 def validate_gitlab_project(project: str) -> bool:
     """
     Validate GitLab project format (namespace/project).
@@ -16,9 +23,7 @@ def validate_gitlab_project(project: str) -> bool:
     if not project:
         return False
 
-    # GitLab project format: namespace/project or namespace/subgroup/project
-    pattern = r'^[\w\-\.]+(/[\w\-\.]+)+$'
-    return bool(re.match(pattern, project))
+    return bool(_GITLAB_PROJECT_RE.match(project))
 
 
 def validate_url(url: str) -> bool:
@@ -34,8 +39,7 @@ def validate_url(url: str) -> bool:
     if not url:
         return False
 
-    pattern = r'^https?://[\w\-\.]+(:\d+)?(/.*)?$'
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def sanitize_filename(filename: str) -> str:
@@ -49,7 +53,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Replace invalid filename characters with underscores
-    return re.sub(r'[<>:"/\\|?*]', '_', filename)
+    return _INVALID_FILENAME_CHARS_RE.sub('_', filename)
 
 
 def validate_access_token(token: Optional[str]) -> bool:
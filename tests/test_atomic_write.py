@@ -0,0 +1,55 @@
+"""Unit tests for the atomic file writer"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from src.utils.files import atomic_write
+
+
+class AtomicWriteTest(unittest.TestCase):
+    """Tests for atomic_write."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = Path(self.tmp_dir.name) / "doc.md"
+
+    def test_keeps_existing_file_mode(self):
+        self.path.write_text("old", encoding='utf-8')
+        os.chmod(self.path, 0o644)
+
+        with atomic_write(self.path) as f:
+            f.write("new")
+
+        self.assertEqual(self.path.read_text(encoding='utf-8'), "new")
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o644)
+
+    def test_new_file_gets_umask_mode(self):
+        old_umask = os.umask(0o022)
+        self.addCleanup(os.umask, old_umask)
+
+        with atomic_write(self.path) as f:
+            f.write("new")
+
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o644)
+
+    def test_failure_leaves_existing_file_and_no_temp_file(self):
+        self.path.write_text("old", encoding='utf-8')
+
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.path) as f:
+                f.write("partial")
+                raise RuntimeError("generation failed")
+
+        self.assertEqual(self.path.read_text(encoding='utf-8'), "old")
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["doc.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()
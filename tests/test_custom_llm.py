@@ -0,0 +1,76 @@
+"""Unit tests for the custom LLM request payload"""
+import asyncio
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from crewai.llms.base_llm import call_stop_override
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from src.llm import GoToCustomLLM
+from src.llm.custom_llm import _get_async_client
+
+REACT_STOP = ["\nObservation:"]
+
+
+class BuildPayloadStopTest(unittest.TestCase):
+    """Tests for stop sequences in GoToCustomLLM._build_payload."""
+
+    def setUp(self):
+        self.llm = GoToCustomLLM(model="test-model", endpoint="http://llm.test")
+
+    def test_agent_stop_words_are_forwarded(self):
+        with call_stop_override(self.llm, REACT_STOP):
+            payload = self.llm._build_payload("hello")
+
+        self.assertEqual(payload["stop"], REACT_STOP)
+
+    def test_no_stop_outside_an_override(self):
+        self.assertNotIn("stop", self.llm._build_payload("hello"))
+
+    def test_explicit_stop_wins(self):
+        with call_stop_override(self.llm, REACT_STOP):
+            payload = self.llm._build_payload("hello", stop=["END"])
+
+        self.assertEqual(payload["stop"], ["END"])
+
+
+class AsyncClientTest(unittest.TestCase):
+    """Tests for the per-event-loop async HTTP clients."""
+
+    def setUp(self):
+        self.llm = GoToCustomLLM(model="test-model", endpoint="http://llm.test")
+
+    def test_one_client_per_loop_until_closed(self):
+        async def use_client():
+            first = _get_async_client()
+            same = _get_async_client()
+            await self.llm.aclose()
+            return first, same, first.is_closed, _get_async_client() is first
+
+        first, same, closed, reused = asyncio.run(use_client())
+
+        self.assertIs(first, same)
+        self.assertTrue(closed)
+        self.assertFalse(reused)
+
+    def test_loops_on_different_threads_get_their_own_client(self):
+        async def use_client():
+            client = _get_async_client()
+            await asyncio.sleep(0.05)
+            await self.llm.aclose()
+            return client
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            clients = list(executor.map(lambda _: asyncio.run(use_client()), range(2)))
+
+        self.assertIsNot(clients[0], clients[1])
+        self.assertTrue(all(client.is_closed for client in clients))
+
+
+if __name__ == "__main__":
+    unittest.main()
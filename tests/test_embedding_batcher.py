@@ -0,0 +1,100 @@
+"""Unit tests for the RAG tool's embedding micro-batcher"""
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from src.tools import rag_tool
+from src.tools.rag_tool import _EmbeddingBatcher
+
+BATCH_SIZE = 4
+
+
+def fake_response(texts):
+    """Build an endpoint response that returns the items out of order, tagged by index."""
+    data = [
+        {"index": i, "embedding": [float(text.lstrip("q"))]}
+        for i, text in enumerate(texts)
+    ]
+    response = mock.Mock()
+    response.json.return_value = {"data": list(reversed(data))}
+    response.raise_for_status.return_value = None
+    return response
+
+
+class EmbeddingBatcherTest(unittest.TestCase):
+    """Tests for _EmbeddingBatcher."""
+
+    def setUp(self):
+        self.session = mock.Mock()
+        patches = [
+            mock.patch.object(rag_tool, "_get_session", return_value=self.session),
+            # Flush only once the whole batch has arrived, never on the timer
+            mock.patch.object(rag_tool, "EMBEDDING_BATCH_MAX_SIZE", BATCH_SIZE),
+            mock.patch.object(rag_tool, "EMBEDDING_BATCH_WAIT_MS", 60_000),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.batcher = _EmbeddingBatcher("http://embeddings.test", "test-model")
+
+    def embed_concurrently(self, texts):
+        """Call embed() for every text from its own thread, returning results or exceptions."""
+        def embed(text):
+            try:
+                return self.batcher.embed(text)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(texts)) as executor:
+            return list(executor.map(embed, texts))
+
+    def test_concurrent_calls_share_one_list_input_post(self):
+        self.session.post.side_effect = lambda url, json, headers, timeout: fake_response(json["input"])
+        texts = [f"q{i}" for i in range(BATCH_SIZE)]
+
+        results = self.embed_concurrently(texts)
+
+        self.assertEqual(self.session.post.call_count, 1)
+        payload = self.session.post.call_args.kwargs["json"]
+        self.assertEqual(sorted(payload["input"]), texts)
+        self.assertEqual(payload["model"], "test-model")
+        # Each caller gets the vector at its own index, despite the shuffled response
+        self.assertEqual(results, [[float(i)] for i in range(BATCH_SIZE)])
+
+    def test_errors_reach_every_caller(self):
+        self.session.post.side_effect = requests.ConnectionError("endpoint down")
+
+        results = self.embed_concurrently([f"q{i}" for i in range(BATCH_SIZE)])
+
+        self.assertEqual(self.session.post.call_count, 1)
+        for result in results:
+            self.assertIsInstance(result, requests.ConnectionError)
+
+    def test_mismatched_response_length_fails_the_batch(self):
+        self.session.post.side_effect = lambda url, json, headers, timeout: fake_response(json["input"][:-1])
+
+        results = self.embed_concurrently([f"q{i}" for i in range(BATCH_SIZE)])
+
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+    def test_single_query_keeps_string_input(self):
+        self.session.post.side_effect = lambda url, json, headers, timeout: fake_response([json["input"]])
+
+        with mock.patch.object(rag_tool, "EMBEDDING_BATCH_WAIT_MS", 1):
+            result = self.batcher.embed("q7")
+
+        self.assertEqual(result, [7.0])
+        self.assertEqual(self.session.post.call_args.kwargs["json"]["input"], "q7")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Unit tests for cleaning the writer's raw output into markdown"""
+import sys
+import unittest
+from pathlib import Path
+
+# Add src directory to Python path
+src_path = Path(__file__).parent.parent
+sys.path.insert(0, str(src_path))
+
+from src.core.crew import extract_markdown_from_response
+
+
+class ExtractMarkdownTest(unittest.TestCase):
+    """Tests for extract_markdown_from_response."""
+
+    def test_json_with_trailing_remark(self):
+        response = '{"documentation": "# Title\\n\\nBody"}\n\nLet me know if you need changes!'
+
+        self.assertEqual(extract_markdown_from_response(response), "# Title\n\nBody")
+
+    def test_fenced_response_with_nested_code_fences(self):
+        inner = "# Title\n\n```python\nprint('hi')\n```\n\nMore text"
+        response = f"```markdown\n{inner}\n```"
+
+        self.assertEqual(extract_markdown_from_response(response), inner)
+
+    def test_response_that_only_opens_a_fence_is_unchanged(self):
+        response = "```markdown\n# Title\n\nBody without a closing fence"
+
+        self.assertEqual(extract_markdown_from_response(response), response)
+
+    def test_plain_markdown_is_unchanged(self):
+        response = "# Title\n\n- item\n\n```bash\nls\n```\n\nDone."
+
+        self.assertEqual(extract_markdown_from_response(response), response)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 """Test script for RAG Milvus Tool"""
 import sys
+import time
 from pathlib import Path
-import json
 
 # Add src directory to Python path
 src_path = Path(__file__).parent.parent
@@ -33,6 +33,9 @@ def test_rag_tool():
         print(f"Database: {settings.rag.db_path}")
         print(f"Model: {settings.rag.embedding_model}")
         print(f"Top K results: {settings.rag.top_k}")
+
+        # Start cold so the timings below reflect real searches, not cache hits
+        RAGMilvusTool.cache_clear()
         print("\n🔍 Search Strategy: Single 'combined_item' collection with 'source' field")
         print("   Results include text and source information")
 
@@ -50,8 +53,9 @@ def test_rag_tool():
             print(f"TEST {i}: {query}")
             print("=" * 60)
 
-            result = tool._run(query)
-            result_data = json.loads(result)
+            start = time.perf_counter()
+            result_data = tool._search(query)
+            elapsed = time.perf_counter() - start
 
             # Check for errors
             if "error" in result_data:
@@ -64,6 +68,7 @@ def test_rag_tool():
             print(f"Query: {result_data.get('query', 'N/A')}")
             print(f"Collection: {result_data.get('collection', 'N/A')}")
             print(f"Results Found: {result_data.get('results_count', 0)}")
+            print(f"Search Time: {elapsed:.3f}s")
             print(f"Sources Found: {len(result_data.get('sources_found', []))}")
             if result_data.get('sources_found'):
                 print(f"Source List: {', '.join(result_data.get('sources_found', []))}")